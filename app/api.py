@@ -7,7 +7,8 @@ Provides REST API and web UI for multi-kit drone surveillance visualization.
 
 import os
 import logging
-from datetime import datetime, timedelta
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from pathlib import Path
 
@@ -35,6 +36,7 @@ DATABASE_URL = os.environ.get(
 API_TITLE = os.environ.get("API_TITLE", "WarDragon Analytics API")
 API_VERSION = os.environ.get("API_VERSION", "1.0.0")
 MAX_QUERY_RANGE_HOURS = int(os.environ.get("MAX_QUERY_RANGE_HOURS", "168"))  # 7 days default
+TEMPLATE_DIR = Path(os.environ.get("TEMPLATE_DIR", Path(__file__).parent / "templates"))
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -217,9 +219,14 @@ async def shutdown():
 
 
 # Helper functions
+def _utcnow() -> datetime:
+    """Current time as a naive UTC datetime (tests patch this to freeze the clock)."""
+    return datetime.utcnow()
+
+
 def parse_time_range(time_range: str) -> tuple[datetime, datetime]:
     """Parse time_range parameter into start and end datetimes."""
-    now = datetime.utcnow()
+    now = _utcnow()
 
     if time_range == "1h":
         start_time = now - timedelta(hours=1)
@@ -234,6 +241,10 @@ def parse_time_range(time_range: str) -> tuple[datetime, datetime]:
             start_str, end_str = times.split(",", 1)
             start_time = datetime.fromisoformat(start_str)
             end_time = datetime.fromisoformat(end_str)
+            # Enforce max query range, counting back from the requested end
+            max_range = timedelta(hours=MAX_QUERY_RANGE_HOURS)
+            if end_time - start_time > max_range:
+                start_time = end_time - max_range
             return start_time, end_time
         except Exception as e:
             logger.warning(f"Invalid custom time range format: {time_range}, error: {e}")
@@ -271,11 +282,16 @@ async def get_kit_status(kit_id: Optional[str] = None) -> List[dict]:
             rows = await conn.fetch(query)
 
         # Calculate status based on last_seen
+        now = _utcnow()
         kits = []
         for row in rows:
             kit = dict(row)
-            if kit["last_seen"]:
-                time_since_seen = (datetime.utcnow() - kit["last_seen"]).total_seconds()
+            last_seen = kit["last_seen"]
+            if last_seen:
+                # TIMESTAMPTZ columns come back timezone-aware; compare in naive UTC
+                if last_seen.tzinfo is not None:
+                    last_seen = last_seen.astimezone(timezone.utc).replace(tzinfo=None)
+                time_since_seen = (now - last_seen).total_seconds()
                 if time_since_seen < 30:
                     kit["status"] = "online"
                 elif time_since_seen < 120:
@@ -1620,6 +1636,13 @@ async def get_night_activity(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@lru_cache(maxsize=4)
+def _read_template(template_path: Path, mtime: float) -> str:
+    """Read a template file, cached per modification time so edits are picked up."""
+    with open(template_path, "r") as f:
+        return f.read()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def serve_ui():
     """
@@ -1628,15 +1651,13 @@ async def serve_ui():
     Returns:
         HTML page with embedded map and filters.
     """
-    template_path = Path(__file__).parent / "templates" / "index.html"
+    template_path = TEMPLATE_DIR / "index.html"
 
     if not template_path.exists():
         raise HTTPException(status_code=500, detail="Template not found")
 
     try:
-        with open(template_path, "r") as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content)
+        return HTMLResponse(content=_read_template(template_path, template_path.stat().st_mtime))
     except Exception as e:
         logger.error(f"Failed to serve UI: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -6,26 +6,32 @@ including mocked database connections, HTTP clients, and configuration data.
 """
 
 import asyncio
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import sys
 
 import pytest
+import pytest_asyncio
 import yaml
 
 # Add app directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def event_loop():
     """
-    Create an event loop for async tests.
+    Create one event loop shared by all async tests in the session.
 
-    This fixture ensures a fresh event loop for each test,
-    preventing issues with closed loops in async tests.
+    The unit test mocks are not bound to a loop, so nothing needs a fresh
+    one per test. The integration db_pool is bound to the loop it was
+    created on, so its tests need this shared loop. The loop is closed
+    when the session ends.
     """
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -352,21 +358,58 @@ def mock_sqlalchemy_create_engine(mock_db_engine):
 # API-SPECIFIC FIXTURES
 # ==============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_datetime_api():
     """Provide a consistent datetime for API testing."""
     return datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
 
 
+class _PoolStub:
+    """Minimal stand-in for asyncpg.Pool: acquire() always yields one connection."""
+
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.fixture(scope="session")
+def _asyncpg_mocks() -> Tuple[AsyncMock, _PoolStub]:
+    """
+    Mock asyncpg connection and the pool stub handing it out, built once per session.
+
+    Tests get them through mock_asyncpg_connection and mock_asyncpg_pool;
+    the connection is reset first, so nothing configured by one test leaks
+    into the next.
+
+    Returns:
+        Tuple of (connection, pool).
+    """
+    conn = AsyncMock()
+    return conn, _PoolStub(conn)
+
+
 @pytest.fixture
-def mock_asyncpg_connection():
+def mock_asyncpg_connection(_asyncpg_mocks):
     """
     Create a mock asyncpg connection with common query responses.
 
     Returns:
         AsyncMock: Mock connection object with fetch/fetchval methods.
     """
-    conn = AsyncMock()
+    conn, _ = _asyncpg_mocks
+
+    # Forget the previous test's calls, return values and side effects
+    conn.reset_mock(return_value=True, side_effect=True)
 
     # Default responses
     conn.fetchval.return_value = 1  # For health checks
@@ -376,193 +419,158 @@ def mock_asyncpg_connection():
 
 
 @pytest.fixture
-def mock_asyncpg_pool(mock_asyncpg_connection):
+def mock_asyncpg_pool(_asyncpg_mocks, mock_asyncpg_connection):
     """
-    Create a mock asyncpg pool with acquire context manager.
+    Create a mock asyncpg pool whose acquire() context yields the mock connection.
 
     Args:
         mock_asyncpg_connection: The mock connection to return when acquiring.
 
     Returns:
-        AsyncMock: Mock pool object.
+        _PoolStub: Lightweight pool stand-in supporting 'async with pool.acquire()'.
     """
-    pool = AsyncMock()
+    return _asyncpg_mocks[1]
+
 
-    # Mock the acquire context manager
-    acquire_context = AsyncMock()
-    acquire_context.__aenter__.return_value = mock_asyncpg_connection
-    acquire_context.__aexit__.return_value = None
-    pool.acquire.return_value = acquire_context
+class SampleTable(Sequence):
+    """
+    Column-oriented sample dataset.
+
+    Values are stored as one list per column. Indexing or iterating yields
+    read-only row mappings built on demand. Since tests can't modify a table,
+    the api_sample_* fixtures build theirs once per session.
+    """
 
-    return pool
+    def __init__(self, **columns: List[Any]):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of rows")
+
+        self.columns = tuple(columns)
+        self._cols = columns
+        self._len = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        return MappingProxyType({name: values[index] for name, values in self._cols.items()})
 
 
 @pytest.fixture
-def api_sample_kits(sample_datetime_api):
+def frozen_api_clock(monkeypatch, sample_datetime_api):
     """
-    Generate sample kit status data for API testing.
+    Freeze the API's clock at sample_datetime_api.
 
     Returns:
-        List[Dict]: List of kit dictionaries with status information.
+        datetime: The frozen time, naive UTC like api._utcnow() returns.
     """
-    return [
-        {
-            "kit_id": "kit001",
-            "name": "Downtown Station",
-            "location": "Downtown",
-            "api_url": "http://kit001.local:8080",
-            "last_seen": sample_datetime_api - timedelta(seconds=10),
-            "status": "online",
-            "created_at": sample_datetime_api - timedelta(days=30)
-        },
-        {
-            "kit_id": "kit002",
-            "name": "Airport Monitor",
-            "location": "Airport",
-            "api_url": "http://kit002.local:8080",
-            "last_seen": sample_datetime_api - timedelta(seconds=60),
-            "status": "stale",
-            "created_at": sample_datetime_api - timedelta(days=20)
-        },
-        {
-            "kit_id": "kit003",
-            "name": "Harbor Watch",
-            "location": "Harbor",
-            "api_url": "http://kit003.local:8080",
-            "last_seen": sample_datetime_api - timedelta(hours=2),
-            "status": "offline",
-            "created_at": sample_datetime_api - timedelta(days=10)
-        }
-    ]
+    now = sample_datetime_api.replace(tzinfo=None)
+    monkeypatch.setattr("api._utcnow", lambda: now)
+    return now
 
 
-@pytest.fixture
-def api_sample_drones(sample_datetime_api):
+@pytest.fixture(scope="session")
+def api_sample_kits(sample_datetime_api):
     """
-    Generate sample drone track data for API testing.
+    Generate sample kit status data for API testing.
 
     Returns:
-        List[Dict]: List of drone track dictionaries.
+        SampleTable: Kit rows with status information.
+    """
+    return SampleTable(
+        kit_id=["kit001", "kit002", "kit003"],
+        name=["Downtown Station", "Airport Monitor", "Harbor Watch"],
+        location=["Downtown", "Airport", "Harbor"],
+        api_url=["http://kit001.local:8080", "http://kit002.local:8080", "http://kit003.local:8080"],
+        last_seen=[
+            sample_datetime_api - timedelta(seconds=10),
+            sample_datetime_api - timedelta(seconds=60),
+            sample_datetime_api - timedelta(hours=2),
+        ],
+        status=["online", "stale", "offline"],
+        created_at=[
+            sample_datetime_api - timedelta(days=30),
+            sample_datetime_api - timedelta(days=20),
+            sample_datetime_api - timedelta(days=10),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def api_sample_drones(sample_datetime_api):
     """
-    return [
-        {
-            "time": sample_datetime_api - timedelta(minutes=5),
-            "kit_id": "kit001",
-            "drone_id": "drone001",
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 100.0,
-            "speed": 15.5,
-            "heading": 90.0,
-            "pilot_lat": 37.7750,
-            "pilot_lon": -122.4200,
-            "home_lat": 37.7750,
-            "home_lon": -122.4200,
-            "mac": "AA:BB:CC:DD:EE:01",
-            "rssi": -65,
-            "freq": 5800.0,
-            "ua_type": "Multirotor",
-            "operator_id": "OP123456",
-            "caa_id": None,
-            "rid_make": "DJI",
-            "rid_model": "Mavic 3",
-            "rid_source": "BT",
-            "track_type": "drone"
-        },
-        {
-            "time": sample_datetime_api - timedelta(minutes=3),
-            "kit_id": "kit002",
-            "drone_id": "drone002",
-            "lat": 37.7850,
-            "lon": -122.4094,
-            "alt": 50.0,
-            "speed": 8.2,
-            "heading": 180.0,
-            "pilot_lat": None,
-            "pilot_lon": None,
-            "home_lat": None,
-            "home_lon": None,
-            "mac": "AA:BB:CC:DD:EE:02",
-            "rssi": -70,
-            "freq": 5850.0,
-            "ua_type": "Helicopter",
-            "operator_id": None,
-            "caa_id": None,
-            "rid_make": "Autel",
-            "rid_model": "EVO II",
-            "rid_source": "WiFi",
-            "track_type": "drone"
-        },
-        {
-            "time": sample_datetime_api - timedelta(minutes=1),
-            "kit_id": "kit001",
-            "drone_id": "aircraft001",
-            "lat": 37.7650,
-            "lon": -122.4294,
-            "alt": 3000.0,
-            "speed": 150.0,
-            "heading": 45.0,
-            "pilot_lat": None,
-            "pilot_lon": None,
-            "home_lat": None,
-            "home_lon": None,
-            "mac": None,
-            "rssi": None,
-            "freq": None,
-            "ua_type": "Fixed Wing",
-            "operator_id": None,
-            "caa_id": "N12345",
-            "rid_make": None,
-            "rid_model": None,
-            "rid_source": "ADSB",
-            "track_type": "aircraft"
-        }
-    ]
-
+    Generate sample drone track data for API testing.
 
-@pytest.fixture
+    Returns:
+        SampleTable: Drone track rows (two drones and one ADS-B aircraft).
+    """
+    return SampleTable(
+        time=[
+            sample_datetime_api - timedelta(minutes=5),
+            sample_datetime_api - timedelta(minutes=3),
+            sample_datetime_api - timedelta(minutes=1),
+        ],
+        kit_id=["kit001", "kit002", "kit001"],
+        drone_id=["drone001", "drone002", "aircraft001"],
+        lat=[37.7749, 37.7850, 37.7650],
+        lon=[-122.4194, -122.4094, -122.4294],
+        alt=[100.0, 50.0, 3000.0],
+        speed=[15.5, 8.2, 150.0],
+        heading=[90.0, 180.0, 45.0],
+        pilot_lat=[37.7750, None, None],
+        pilot_lon=[-122.4200, None, None],
+        home_lat=[37.7750, None, None],
+        home_lon=[-122.4200, None, None],
+        mac=["AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02", None],
+        rssi=[-65, -70, None],
+        freq=[5800.0, 5850.0, None],
+        ua_type=["Multirotor", "Helicopter", "Fixed Wing"],
+        operator_id=["OP123456", None, None],
+        caa_id=[None, None, "N12345"],
+        rid_make=["DJI", "Autel", None],
+        rid_model=["Mavic 3", "EVO II", None],
+        rid_source=["BT", "WiFi", "ADSB"],
+        track_type=["drone", "drone", "aircraft"],
+    )
+
+
+@pytest.fixture(scope="session")
 def api_sample_signals(sample_datetime_api):
     """
     Generate sample FPV signal detection data for API testing.
 
     Returns:
-        List[Dict]: List of signal detection dictionaries.
+        SampleTable: Signal detection rows.
     """
-    return [
-        {
-            "time": sample_datetime_api - timedelta(minutes=2),
-            "kit_id": "kit001",
-            "freq_mhz": 5800.0,
-            "power_dbm": -45.0,
-            "bandwidth_mhz": 8.0,
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 10.0,
-            "detection_type": "analog"
-        },
-        {
-            "time": sample_datetime_api - timedelta(minutes=4),
-            "kit_id": "kit002",
-            "freq_mhz": 5850.0,
-            "power_dbm": -50.0,
-            "bandwidth_mhz": 10.0,
-            "lat": 37.7850,
-            "lon": -122.4094,
-            "alt": 15.0,
-            "detection_type": "dji"
-        },
-        {
-            "time": sample_datetime_api - timedelta(minutes=6),
-            "kit_id": "kit001",
-            "freq_mhz": 5900.0,
-            "power_dbm": -55.0,
-            "bandwidth_mhz": 6.0,
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 10.0,
-            "detection_type": "analog"
-        }
-    ]
+    return SampleTable(
+        time=[
+            sample_datetime_api - timedelta(minutes=2),
+            sample_datetime_api - timedelta(minutes=4),
+            sample_datetime_api - timedelta(minutes=6),
+        ],
+        kit_id=["kit001", "kit002", "kit001"],
+        freq_mhz=[5800.0, 5850.0, 5900.0],
+        power_dbm=[-45.0, -50.0, -55.0],
+        bandwidth_mhz=[8.0, 10.0, 6.0],
+        lat=[37.7749, 37.7850, 37.7749],
+        lon=[-122.4194, -122.4094, -122.4194],
+        alt=[10.0, 15.0, 10.0],
+        detection_type=["analog", "dji", "analog"],
+    )
+
+
+class MockRecord(dict):
+    """
+    Simple stand-in for asyncpg.Record, built from a dictionary.
+
+    A plain dict already supports what the API uses on records:
+    row[key], row.keys() and dict(row).
+    """
+
+    __slots__ = ()
 
 
 @pytest.fixture
@@ -573,35 +581,73 @@ def mock_asyncpg_row():
     Returns:
         Callable: Function that creates mock row with dict() and keys() methods.
     """
-    def create_row(data: Dict[str, Any]):
-        """Create a mock asyncpg Record object from a dictionary."""
-        # Create a simple class that behaves like asyncpg.Record
-        class MockRecord(dict):
-            def __init__(self, data):
-                super().__init__(data)
-                self._data = data
+    return MockRecord
 
-            def keys(self):
-                return self._data.keys()
 
-            def __getitem__(self, key):
-                return self._data[key]
+@pytest.fixture(scope="session")
+def api_sample_kit_rows(api_sample_kits) -> List[MockRecord]:
+    """api_sample_kits as mock asyncpg Records, built once per session."""
+    return [MockRecord(kit) for kit in api_sample_kits]
 
-        return MockRecord(data)
 
-    return create_row
+@pytest.fixture(scope="session")
+def api_sample_drone_rows(api_sample_drones) -> List[MockRecord]:
+    """api_sample_drones as mock asyncpg Records, built once per session."""
+    return [MockRecord(drone) for drone in api_sample_drones]
 
 
-@pytest.fixture
-def client_with_mocked_db(mock_asyncpg_pool):
+@pytest.fixture(scope="session")
+def api_sample_signal_rows(api_sample_signals) -> List[MockRecord]:
+    """api_sample_signals as mock asyncpg Records, built once per session."""
+    return [MockRecord(signal) for signal in api_sample_signals]
+
+
+def _index_rows(rows: List[MockRecord], **columns: str) -> Dict[str, Dict[Any, List[MockRecord]]]:
     """
-    Create a FastAPI TestClient with mocked database.
+    Group rows by the value of each column, e.g. index["kit"]["kit001"].
 
-    This fixture patches the global db_pool and provides a test client
-    that doesn't require actual database connections.
+    Keyword names are the index keys, values are the row columns to group on.
+    """
+    index = {}
+    for key, column in columns.items():
+        groups = defaultdict(list)
+        for row in rows:
+            groups[row.get(column)].append(row)
+        index[key] = dict(groups)
+    return index
 
-    Args:
-        mock_asyncpg_pool: The mock database pool fixture.
+
+@pytest.fixture(scope="session")
+def api_sample_drones_by(api_sample_drone_rows) -> Dict[str, Dict[Any, List[MockRecord]]]:
+    """api_sample_drone_rows grouped by kit, rid_make and track_type."""
+    return _index_rows(
+        api_sample_drone_rows,
+        kit="kit_id",
+        rid_make="rid_make",
+        track_type="track_type",
+    )
+
+
+@pytest.fixture(scope="session")
+def api_sample_signals_by(api_sample_signal_rows) -> Dict[str, Dict[Any, List[MockRecord]]]:
+    """api_sample_signal_rows grouped by kit and detection_type."""
+    return _index_rows(
+        api_sample_signal_rows,
+        kit="kit_id",
+        detection_type="detection_type",
+    )
+
+
+@pytest.fixture(scope="session")
+def api_test_client():
+    """
+    FastAPI TestClient shared by the whole session.
+
+    The app and its startup/shutdown handlers run once. Startup's
+    create_pool is patched, so no database is needed; tests swap in their
+    own pool with patch("api.db_pool", ...) (see client_with_mocked_db).
+    Header, cookie and dependency_overrides changes a test makes are
+    undone after it by _reset_api_test_client.
 
     Yields:
         TestClient: FastAPI test client instance.
@@ -611,11 +657,125 @@ def client_with_mocked_db(mock_asyncpg_pool):
     # Import after adding to sys.path
     from api import app
 
-    with patch("api.db_pool", mock_asyncpg_pool):
+    # Build the OpenAPI schema up front; FastAPI caches it on the app,
+    # so /openapi.json is served from the cache in every test
+    app.openapi()
+
+    with patch("api.asyncpg.create_pool", AsyncMock(return_value=AsyncMock())):
         with TestClient(app) as client:
             yield client
 
 
+@pytest.fixture(autouse=True)
+def _reset_api_test_client(request):
+    """
+    Undo per-test changes to the shared api_test_client.
+
+    Restores its headers, cookies and the app's dependency_overrides.
+    Only acts for tests that use the session client, so other tests never
+    start the app.
+    """
+    if "api_test_client" not in request.fixturenames:
+        yield
+        return
+
+    client = request.getfixturevalue("api_test_client")
+    headers = client.headers.copy()
+    overrides = dict(client.app.dependency_overrides)
+
+    yield
+
+    client.headers = headers
+    client.cookies.clear()
+    client.app.dependency_overrides.clear()
+    client.app.dependency_overrides.update(overrides)
+
+
+@pytest_asyncio.fixture
+async def async_api_client():
+    """
+    httpx.AsyncClient that calls the FastAPI app in-process over ASGI.
+
+    No TestClient portal thread is involved. The app's startup and
+    shutdown handlers do not run over ASGITransport, so api.db_pool is
+    whatever the test installs: request mocked_db_pool for endpoints that
+    query the database, or db_unavailable for the 503 paths.
+
+    Yields:
+        httpx.AsyncClient: Client with base_url http://test.
+    """
+    import httpx
+
+    # Import after adding to sys.path
+    from api import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def mocked_db_pool(monkeypatch, mock_asyncpg_pool):
+    """
+    Install mock_asyncpg_pool as the API's global db_pool for one test.
+
+    Args:
+        monkeypatch: Pytest's monkeypatch fixture (undoes the patch afterwards).
+        mock_asyncpg_pool: The mock database pool fixture.
+
+    Returns:
+        _PoolStub: The installed mock pool.
+    """
+    import api
+
+    monkeypatch.setattr(api, "db_pool", mock_asyncpg_pool)
+    return mock_asyncpg_pool
+
+
+@pytest.fixture
+def client_with_mocked_db(api_test_client, mocked_db_pool):
+    """
+    Provide the session TestClient with the mocked database pool.
+
+    No actual database connection is made.
+
+    Args:
+        api_test_client: The session-scoped test client.
+        mocked_db_pool: The mock pool, installed as api.db_pool.
+
+    Returns:
+        TestClient: FastAPI test client instance.
+    """
+    return api_test_client
+
+
+@pytest.fixture
+def db_unavailable(monkeypatch):
+    """
+    Unset the API's global db_pool for one test, as if startup had failed.
+
+    Args:
+        monkeypatch: Pytest's monkeypatch fixture (undoes the patch afterwards).
+    """
+    import api
+
+    monkeypatch.setattr(api, "db_pool", None)
+
+
+@pytest.fixture
+def client_without_db(api_test_client, db_unavailable):
+    """
+    Provide the session TestClient with no database pool.
+
+    Args:
+        api_test_client: The session-scoped test client.
+        db_unavailable: Unsets api.db_pool for the test.
+
+    Returns:
+        TestClient: FastAPI test client instance.
+    """
+    return api_test_client
+
+
 @pytest.fixture
 def mock_template_file(tmp_path):
     """
@@ -13,13 +13,14 @@ Requirements:
 import asyncio
 import os
 import time
+from collections import Counter
 from datetime import datetime, timezone
 from typing import Generator, AsyncGenerator
 import subprocess
 import pytest
+import pytest_asyncio
 import asyncpg
 import httpx
-from sqlalchemy import create_engine, text
 
 
 # Test database configuration
@@ -35,6 +36,220 @@ TEST_API_HOST = os.getenv("TEST_API_HOST", "localhost")
 TEST_API_PORT = os.getenv("TEST_API_PORT", "8090")
 TEST_API_URL = f"http://{TEST_API_HOST}:{TEST_API_PORT}"
 
+# Services defined in docker-compose.test.yml
+TEST_SERVICES = {"timescaledb-test", "web-test"}
+
+# Column order used when bulk loading sample data with COPY
+KIT_COLUMNS = ("kit_id", "name", "location", "api_url", "status", "last_seen")
+DRONE_COLUMNS = (
+    "time", "kit_id", "drone_id", "lat", "lon", "alt", "speed", "heading",
+    "pilot_lat", "pilot_lon", "home_lat", "home_lon",
+    "mac", "rssi", "freq", "ua_type", "operator_id", "caa_id",
+    "rid_make", "rid_model", "rid_source", "track_type",
+)
+SIGNAL_COLUMNS = (
+    "time", "kit_id", "freq_mhz", "power_dbm", "bandwidth_mhz",
+    "lat", "lon", "alt", "detection_type",
+)
+HEALTH_COLUMNS = (
+    "time", "kit_id", "lat", "lon", "alt",
+    "cpu_percent", "memory_percent", "disk_percent",
+    "uptime_hours", "temp_cpu", "temp_gpu",
+)
+
+# Columns loaded for each table by read_only_db
+SAMPLE_COLUMNS = {
+    "kits": KIT_COLUMNS,
+    "drones": DRONE_COLUMNS,
+    "signals": SIGNAL_COLUMNS,
+    "system_health": HEALTH_COLUMNS,
+}
+
+
+# Static kit configurations loaded by sample_kits; last_seen is filled in per test
+_TEST_KITS = (
+    {
+        "kit_id": "test-kit-001",
+        "name": "Test Kit Alpha",
+        "location": "Test Site A",
+        "api_url": "http://test-kit-001:8088",
+        "status": "online",
+    },
+    {
+        "kit_id": "test-kit-002",
+        "name": "Test Kit Bravo",
+        "location": "Test Site B",
+        "api_url": "http://test-kit-002:8088",
+        "status": "online",
+    },
+    {
+        "kit_id": "test-kit-003",
+        "name": "Test Kit Charlie",
+        "location": "Test Site C",
+        "api_url": "http://test-kit-003:8088",
+        "status": "offline",
+    },
+)
+
+
+# Sample rows for the sample_* fixtures; time is filled in per test
+_DRONE_TEMPLATES = (
+    # DJI Mavic 3 from test-kit-001
+    {
+        "kit_id": "test-kit-001",
+        "drone_id": "DJI-001",
+        "lat": 37.7749,
+        "lon": -122.4194,
+        "alt": 120.5,
+        "speed": 15.2,
+        "heading": 180.0,
+        "pilot_lat": 37.7740,
+        "pilot_lon": -122.4180,
+        "home_lat": 37.7740,
+        "home_lon": -122.4180,
+        "mac": "AA:BB:CC:DD:EE:01",
+        "rssi": -65,
+        "freq": 2437.0,
+        "ua_type": "Quadcopter",
+        "operator_id": "OP-12345",
+        "rid_make": "DJI",
+        "rid_model": "Mavic 3",
+        "rid_source": "ble",
+        "track_type": "drone"
+    },
+    # DJI Mini 4 Pro from test-kit-002
+    {
+        "kit_id": "test-kit-002",
+        "drone_id": "DJI-002",
+        "lat": 37.7850,
+        "lon": -122.4100,
+        "alt": 85.0,
+        "speed": 8.5,
+        "heading": 90.0,
+        "pilot_lat": 37.7845,
+        "pilot_lon": -122.4090,
+        "mac": "AA:BB:CC:DD:EE:02",
+        "rssi": -70,
+        "rid_make": "DJI",
+        "rid_model": "Mini 4 Pro",
+        "rid_source": "wifi",
+        "track_type": "drone"
+    },
+    # Autel EVO II from test-kit-001
+    {
+        "kit_id": "test-kit-001",
+        "drone_id": "AUTEL-001",
+        "lat": 37.7650,
+        "lon": -122.4300,
+        "alt": 150.0,
+        "speed": 12.0,
+        "heading": 270.0,
+        "rid_make": "Autel",
+        "rid_model": "EVO II",
+        "track_type": "drone"
+    },
+    # Aircraft (ADS-B) from test-kit-002
+    {
+        "kit_id": "test-kit-002",
+        "drone_id": "A1B2C3",
+        "lat": 37.8000,
+        "lon": -122.4000,
+        "alt": 3000.0,
+        "speed": 150.0,
+        "heading": 45.0,
+        "track_type": "aircraft"
+    },
+    # Same DJI-001 detected by test-kit-002 (multi-kit tracking)
+    {
+        "kit_id": "test-kit-002",
+        "drone_id": "DJI-001",
+        "lat": 37.7749,
+        "lon": -122.4194,
+        "alt": 120.5,
+        "speed": 15.2,
+        "heading": 180.0,
+        "mac": "AA:BB:CC:DD:EE:01",
+        "rssi": -75,  # Weaker signal from farther kit
+        "rid_make": "DJI",
+        "rid_model": "Mavic 3",
+        "track_type": "drone"
+    }
+)
+
+_SIGNAL_TEMPLATES = (
+    # Analog FPV on Race Band 1 from test-kit-001
+    {
+        "kit_id": "test-kit-001",
+        "freq_mhz": 5658.0,
+        "power_dbm": -45.5,
+        "bandwidth_mhz": 10.0,
+        "lat": 37.7749,
+        "lon": -122.4194,
+        "alt": 50.0,
+        "detection_type": "analog"
+    },
+    # Analog FPV on Race Band 8 from test-kit-001
+    {
+        "kit_id": "test-kit-001",
+        "freq_mhz": 5917.0,
+        "power_dbm": -52.0,
+        "bandwidth_mhz": 10.0,
+        "lat": 37.7749,
+        "lon": -122.4194,
+        "detection_type": "analog"
+    },
+    # DJI digital FPV from test-kit-002
+    {
+        "kit_id": "test-kit-002",
+        "freq_mhz": 5745.0,
+        "power_dbm": -38.0,
+        "bandwidth_mhz": 20.0,
+        "lat": 37.7850,
+        "lon": -122.4100,
+        "detection_type": "dji"
+    },
+    # Weak analog signal from test-kit-002
+    {
+        "kit_id": "test-kit-002",
+        "freq_mhz": 5800.0,
+        "power_dbm": -78.5,
+        "bandwidth_mhz": 10.0,
+        "detection_type": "analog"
+    }
+)
+
+_HEALTH_TEMPLATES = (
+    {
+        "kit_id": "test-kit-001",
+        "lat": 37.7749,
+        "lon": -122.4194,
+        "alt": 10.0,
+        "cpu_percent": 45.5,
+        "memory_percent": 62.3,
+        "disk_percent": 38.7,
+        "uptime_hours": 72.5,
+        "temp_cpu": 55.0,
+        "temp_gpu": 48.0
+    },
+    {
+        "kit_id": "test-kit-002",
+        "lat": 37.7850,
+        "lon": -122.4100,
+        "alt": 15.0,
+        "cpu_percent": 38.2,
+        "memory_percent": 55.1,
+        "disk_percent": 42.0,
+        "uptime_hours": 120.0,
+        "temp_cpu": 52.0,
+        "temp_gpu": 45.0
+    }
+)
+
+
+def as_records(rows: list[dict], columns: tuple) -> list[tuple]:
+    """Convert fixture dicts to tuples in column order; missing optional fields become NULL."""
+    return [tuple(row.get(column) for column in columns) for row in rows]
+
 
 @pytest.fixture(scope="session")
 def docker_compose_file():
@@ -42,65 +257,125 @@ def docker_compose_file():
     return "docker-compose.test.yml"
 
 
+async def check_services(client: httpx.AsyncClient) -> bool:
+    """Probe the database and the API concurrently; True if both answer."""
+    async def check_db():
+        conn = await asyncpg.connect(TEST_DATABASE_URL, timeout=2)
+        try:
+            await conn.fetchval("SELECT 1")
+        finally:
+            await conn.close()
+
+    async def check_api():
+        response = await client.get("/health")
+        return response.status_code == 200
+
+    db_result, api_result = await asyncio.gather(
+        check_db(), check_api(), return_exceptions=True
+    )
+    return not isinstance(db_result, Exception) and api_result is True
+
+
+def running_services(compose_file: str, project_dir: str) -> set[str]:
+    """Names of the compose services that are currently running (empty if unknown)."""
+    try:
+        result = subprocess.run(
+            ["docker-compose", "-f", compose_file, "ps", "--services", "--filter", "status=running"],
+            cwd=project_dir,
+            check=True,
+            capture_output=True,
+            text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    return set(result.stdout.split())
+
+
+def wait_for_services(max_wait: float) -> bool:
+    """
+    Poll the database and API until both answer or max_wait seconds pass.
+
+    Always probes at least once. The HTTP client and event loop are
+    created once and reused by every poll.
+    """
+    loop = asyncio.new_event_loop()
+    client = httpx.AsyncClient(base_url=TEST_API_URL, timeout=1.0)
+    deadline = time.time() + max_wait
+    delay = 0.1
+
+    try:
+        while True:
+            if loop.run_until_complete(check_services(client)):
+                return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.25)
+    finally:
+        loop.run_until_complete(client.aclose())
+        loop.close()
+
+
 @pytest.fixture(scope="session")
 def docker_services():
     """
     Ensure Docker Compose services are running for the test session.
 
     This fixture starts the test stack (TimescaleDB, API, Collector) and
-    ensures they are healthy before running tests.
+    ensures they are healthy before running tests. A stack that is already
+    running is reused as-is and left running afterwards; set
+    KEEP_TEST_STACK=1 to also keep a stack started here.
     """
     compose_file = "docker-compose.test.yml"
     project_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
     compose_path = os.path.join(project_dir, compose_file)
+    keep_stack = os.getenv("KEEP_TEST_STACK") == "1"
+
+    if wait_for_services(max_wait=0):
+        print("\nPASS Reusing running test services")
+        yield
+        return
 
     if not os.path.exists(compose_path):
         pytest.skip(f"Docker Compose file not found: {compose_path}")
 
-    # Start services
-    print("\n🐳 Starting Docker Compose services...")
-    try:
-        subprocess.run(
-            ["docker-compose", "-f", compose_file, "up", "-d"],
-            cwd=project_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-    except subprocess.CalledProcessError as e:
-        pytest.fail(f"Failed to start Docker services: {e.stderr}")
+    # Start services, unless the containers are already up and only need
+    # to finish starting
+    started = not TEST_SERVICES <= running_services(compose_file, project_dir)
+    if started:
+        print("\n🐳 Starting Docker Compose services...")
+        try:
+            subprocess.run(
+                ["docker-compose", "-f", compose_file, "up", "-d"],
+                cwd=project_dir,
+                check=True,
+                capture_output=True,
+                text=True
+            )
+        except subprocess.CalledProcessError as e:
+            pytest.fail(f"Failed to start Docker services: {e.stderr}")
 
     # Wait for services to be healthy
     print("⏳ Waiting for services to become healthy...")
     max_wait = 60  # seconds
-    start_time = time.time()
 
-    while time.time() - start_time < max_wait:
-        try:
-            # Check database
-            engine = create_engine(TEST_DATABASE_URL)
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            engine.dispose()
-
-            # Check API
-            response = httpx.get(f"{TEST_API_URL}/health", timeout=5)
-            if response.status_code == 200:
-                print("PASS All services are healthy!")
-                break
-        except Exception:
-            time.sleep(2)
+    if wait_for_services(max_wait):
+        print("PASS All services are healthy!")
     else:
         # Cleanup on failure
-        subprocess.run(
-            ["docker-compose", "-f", compose_file, "down", "-v"],
-            cwd=project_dir,
-            capture_output=True
-        )
+        if started:
+            subprocess.run(
+                ["docker-compose", "-f", compose_file, "down", "-v"],
+                cwd=project_dir,
+                capture_output=True
+            )
         pytest.fail("Services failed to become healthy within timeout")
 
     yield
 
+    if keep_stack or not started:
+        return
+
     # Teardown: stop and remove containers
     print("\n🧹 Stopping Docker Compose services...")
     subprocess.run(
@@ -110,49 +385,112 @@ def docker_services():
     )
 
 
-@pytest.fixture
-async def db_pool(docker_services) -> AsyncGenerator[asyncpg.Pool, None]:
+@pytest.fixture(scope="session")
+def db_pool(event_loop, docker_services) -> Generator[asyncpg.Pool, None, None]:
     """
-    Async database connection pool for tests.
+    Async database connection pool shared by the whole test session.
 
-    Provides a connection pool to TimescaleDB for direct database operations.
+    Created once so connection setup is paid once rather than per test;
+    tests get their own connections from it through db_conn. The pool is
+    opened on the session event loop directly so pytest-asyncio does not
+    bind it to a separate session-scoped loop.
     """
-    pool = await asyncpg.create_pool(
+    pool = event_loop.run_until_complete(asyncpg.create_pool(
         TEST_DATABASE_URL,
         min_size=2,
         max_size=5,
-        command_timeout=30
-    )
+        command_timeout=30,
+        # Test queries are too small to benefit from JIT, and the throwaway
+        # test database does not need to wait for WAL flushes on commit
+        server_settings={"jit": "off", "synchronous_commit": "off"}
+    ))
 
     yield pool
 
-    await pool.close()
+    event_loop.run_until_complete(pool.close())
+
+
+@pytest.fixture(scope="session")
+def db_conn(event_loop, db_pool) -> Generator[asyncpg.Connection, None, None]:
+    """
+    Single database connection shared by the tests.
+
+    Acquired from the pool once per session, on the session event loop
+    like db_pool itself, and released when the session ends.
+    """
+    conn = event_loop.run_until_complete(db_pool.acquire())
+
+    yield conn
+
+    event_loop.run_until_complete(db_pool.release(conn))
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """
+    Timestamp of the session start, taken once.
+
+    Tests write it instead of calling datetime.now() themselves, so inserted
+    rows don't depend on when (or in which order) a test runs.
+    """
+    return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-@pytest.fixture
-async def db_conn(db_pool) -> AsyncGenerator[asyncpg.Connection, None]:
+@pytest.fixture(scope="session")
+def sample_data(now) -> dict[str, list[dict]]:
     """
-    Single database connection for tests.
+    Sample rows for every table, built once per session.
 
-    Acquires a connection from the pool for test operations.
+    Keyed by table name; all rows share the session start as their timestamp.
     """
-    async with db_pool.acquire() as conn:
-        yield conn
+    return {
+        "kits": [{**kit, "last_seen": now} for kit in _TEST_KITS],
+        "drones": [{"time": now, **row} for row in _DRONE_TEMPLATES],
+        "signals": [{"time": now, **row} for row in _SIGNAL_TEMPLATES],
+        "system_health": [{"time": now, **row} for row in _HEALTH_TEMPLATES],
+    }
 
 
-@pytest.fixture
-async def clean_database(db_conn):
+@pytest.fixture(scope="session")
+def expected_counts(sample_data) -> Counter:
+    """
+    Number of sample rows per (table, column, value), computed once per session.
+
+    e.g. expected_counts["drones", "rid_make", "DJI"]; combinations that
+    don't occur count as 0.
+    """
+    counts = Counter()
+    for table in ("drones", "signals"):
+        for row in sample_data[table]:
+            for column in ("kit_id", "rid_make", "track_type", "detection_type"):
+                if row.get(column) is not None:
+                    counts[table, column, row[column]] += 1
+    return counts
+
+
+@pytest.fixture(scope="session")
+def database_state() -> dict[str, bool]:
+    """
+    Tracks whether the tables currently hold exactly the session's sample data.
+
+    Fixtures that commit any other write must clear "seeded" (clean_database
+    does) or undo the write in their teardown (sample_kits does); test-only
+    writes belong in db_transaction.
+    """
+    return {"seeded": False}
+
+
+@pytest_asyncio.fixture
+async def clean_database(db_conn, database_state):
     """
     Clean all data from test database tables before each test.
 
     This fixture ensures each test starts with a clean slate.
     Runs before each test that uses it.
     """
-    # Delete data from all tables
-    await db_conn.execute("DELETE FROM system_health")
-    await db_conn.execute("DELETE FROM signals")
-    await db_conn.execute("DELETE FROM drones")
-    await db_conn.execute("DELETE FROM kits")
+    # Empty all tables in one statement (one round trip instead of four)
+    await db_conn.execute("TRUNCATE TABLE system_health, signals, drones, kits RESTART IDENTITY CASCADE")
+    database_state["seeded"] = False
 
     # Reset sequences if any
     # Note: Our tables don't use sequences, but keeping this for future-proofing
@@ -163,18 +501,59 @@ async def clean_database(db_conn):
     # Comment out the deletes below to preserve data for debugging failed tests
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
+async def read_only_db(db_conn, database_state, sample_data):
+    """
+    Make the tables hold exactly the sample data, for tests that only read it.
+
+    The tables are truncated and loaded with COPY only when they don't
+    already hold it: the first time, and after a test that used
+    clean_database. Consecutive read-only tests share one load.
+    """
+    if not database_state["seeded"]:
+        await db_conn.execute("TRUNCATE TABLE system_health, signals, drones, kits RESTART IDENTITY CASCADE")
+        for table, columns in SAMPLE_COLUMNS.items():
+            await db_conn.copy_records_to_table(
+                table, records=as_records(sample_data[table], columns), columns=columns
+            )
+        database_state["seeded"] = True
+
+
+@pytest_asyncio.fixture
+async def db_transaction(db_conn):
+    """
+    Run the test's db_conn work in a transaction and roll it back afterwards.
+
+    For tests that only talk to the database: nothing they write is
+    committed, so they need neither clean_database nor cleanup. Data
+    written this way is invisible to the API, which uses its own connections.
+    """
+    transaction = db_conn.transaction()
+    await transaction.start()
+
+    yield
+
+    await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
 def api_client(docker_services) -> Generator[httpx.Client, None, None]:
     """
     Synchronous HTTP client for API testing.
 
-    Provides a configured HTTP client for making requests to the test API.
+    Provides a configured HTTP client for making requests to the test API,
+    shared by the whole session so its connections are kept alive.
     """
-    with httpx.Client(base_url=TEST_API_URL, timeout=30.0) as client:
+    with httpx.Client(
+        base_url=TEST_API_URL,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=60.0),
+        transport=httpx.HTTPTransport(retries=1),
+    ) as client:
         yield client
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def async_api_client(docker_services) -> AsyncGenerator[httpx.AsyncClient, None]:
     """
     Async HTTP client for API testing.
@@ -185,58 +564,33 @@ async def async_api_client(docker_services) -> AsyncGenerator[httpx.AsyncClient,
         yield client
 
 
-@pytest.fixture
-async def sample_kits(db_conn) -> list[dict]:
+@pytest_asyncio.fixture
+async def sample_kits(db_conn, read_only_db, sample_data) -> AsyncGenerator[list[dict], None]:
     """
-    Insert sample kit configurations into the database.
+    Sample kit configurations, loaded into the database.
+
+    last_seen is refreshed for each test, because the API reports a kit
+    as online only within 30 seconds of it, and put back afterwards so
+    the tables still hold exactly the sample data for read_only_db.
 
     Returns:
         List of kit dictionaries with their configuration.
     """
-    kits = [
-        {
-            "kit_id": "test-kit-001",
-            "name": "Test Kit Alpha",
-            "location": "Test Site A",
-            "api_url": "http://test-kit-001:8088",
-            "status": "online",
-            "last_seen": datetime.now(timezone.utc)
-        },
-        {
-            "kit_id": "test-kit-002",
-            "name": "Test Kit Bravo",
-            "location": "Test Site B",
-            "api_url": "http://test-kit-002:8088",
-            "status": "online",
-            "last_seen": datetime.now(timezone.utc)
-        },
-        {
-            "kit_id": "test-kit-003",
-            "name": "Test Kit Charlie",
-            "location": "Test Site C",
-            "api_url": "http://test-kit-003:8088",
-            "status": "offline",
-            "last_seen": datetime.now(timezone.utc)
-        }
-    ]
-
-    for kit in kits:
-        await db_conn.execute(
-            """
-            INSERT INTO kits (kit_id, name, location, api_url, status, last_seen)
-            VALUES ($1, $2, $3, $4, $5, $6)
-            """,
-            kit["kit_id"], kit["name"], kit["location"],
-            kit["api_url"], kit["status"], kit["last_seen"]
-        )
+    now = datetime.now(timezone.utc)
+    await db_conn.execute("UPDATE kits SET last_seen = $1", now)
 
-    return kits
+    yield [{**kit, "last_seen": now} for kit in sample_data["kits"]]
+
+    await db_conn.executemany(
+        "UPDATE kits SET last_seen = $2 WHERE kit_id = $1",
+        [(kit["kit_id"], kit["last_seen"]) for kit in sample_data["kits"]],
+    )
 
 
-@pytest.fixture
-async def sample_drones(db_conn, sample_kits) -> list[dict]:
+@pytest_asyncio.fixture
+async def sample_drones(read_only_db, sample_data) -> list[dict]:
     """
-    Insert sample drone tracks into the database.
+    Sample drone tracks, loaded into the database.
 
     Creates diverse drone data including:
     - DJI drones with Remote ID
@@ -247,129 +601,13 @@ async def sample_drones(db_conn, sample_kits) -> list[dict]:
     Returns:
         List of drone dictionaries with their data.
     """
-    now = datetime.now(timezone.utc)
+    return sample_data["drones"]
 
-    drones = [
-        # DJI Mavic 3 from test-kit-001
-        {
-            "time": now,
-            "kit_id": "test-kit-001",
-            "drone_id": "DJI-001",
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 120.5,
-            "speed": 15.2,
-            "heading": 180.0,
-            "pilot_lat": 37.7740,
-            "pilot_lon": -122.4180,
-            "home_lat": 37.7740,
-            "home_lon": -122.4180,
-            "mac": "AA:BB:CC:DD:EE:01",
-            "rssi": -65,
-            "freq": 2437.0,
-            "ua_type": "Quadcopter",
-            "operator_id": "OP-12345",
-            "rid_make": "DJI",
-            "rid_model": "Mavic 3",
-            "rid_source": "ble",
-            "track_type": "drone"
-        },
-        # DJI Mini 4 Pro from test-kit-002
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "drone_id": "DJI-002",
-            "lat": 37.7850,
-            "lon": -122.4100,
-            "alt": 85.0,
-            "speed": 8.5,
-            "heading": 90.0,
-            "pilot_lat": 37.7845,
-            "pilot_lon": -122.4090,
-            "mac": "AA:BB:CC:DD:EE:02",
-            "rssi": -70,
-            "rid_make": "DJI",
-            "rid_model": "Mini 4 Pro",
-            "rid_source": "wifi",
-            "track_type": "drone"
-        },
-        # Autel EVO II from test-kit-001
-        {
-            "time": now,
-            "kit_id": "test-kit-001",
-            "drone_id": "AUTEL-001",
-            "lat": 37.7650,
-            "lon": -122.4300,
-            "alt": 150.0,
-            "speed": 12.0,
-            "heading": 270.0,
-            "rid_make": "Autel",
-            "rid_model": "EVO II",
-            "track_type": "drone"
-        },
-        # Aircraft (ADS-B) from test-kit-002
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "drone_id": "A1B2C3",
-            "lat": 37.8000,
-            "lon": -122.4000,
-            "alt": 3000.0,
-            "speed": 150.0,
-            "heading": 45.0,
-            "track_type": "aircraft"
-        },
-        # Same DJI-001 detected by test-kit-002 (multi-kit tracking)
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "drone_id": "DJI-001",
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 120.5,
-            "speed": 15.2,
-            "heading": 180.0,
-            "mac": "AA:BB:CC:DD:EE:01",
-            "rssi": -75,  # Weaker signal from farther kit
-            "rid_make": "DJI",
-            "rid_model": "Mavic 3",
-            "track_type": "drone"
-        }
-    ]
-
-    for drone in drones:
-        await db_conn.execute(
-            """
-            INSERT INTO drones (
-                time, kit_id, drone_id, lat, lon, alt, speed, heading,
-                pilot_lat, pilot_lon, home_lat, home_lon,
-                mac, rssi, freq, ua_type, operator_id, caa_id,
-                rid_make, rid_model, rid_source, track_type
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8,
-                $9, $10, $11, $12,
-                $13, $14, $15, $16, $17, $18,
-                $19, $20, $21, $22
-            )
-            """,
-            drone["time"], drone["kit_id"], drone["drone_id"],
-            drone.get("lat"), drone.get("lon"), drone.get("alt"),
-            drone.get("speed"), drone.get("heading"),
-            drone.get("pilot_lat"), drone.get("pilot_lon"),
-            drone.get("home_lat"), drone.get("home_lon"),
-            drone.get("mac"), drone.get("rssi"), drone.get("freq"),
-            drone.get("ua_type"), drone.get("operator_id"), drone.get("caa_id"),
-            drone.get("rid_make"), drone.get("rid_model"),
-            drone.get("rid_source"), drone["track_type"]
-        )
-
-    return drones
 
-
-@pytest.fixture
-async def sample_signals(db_conn, sample_kits) -> list[dict]:
+@pytest_asyncio.fixture
+async def sample_signals(read_only_db, sample_data) -> list[dict]:
     """
-    Insert sample FPV signal detections into the database.
+    Sample FPV signal detections, loaded into the database.
 
     Creates diverse signal data including:
     - 5.8GHz analog FPV signals
@@ -379,123 +617,15 @@ async def sample_signals(db_conn, sample_kits) -> list[dict]:
     Returns:
         List of signal dictionaries with their data.
     """
-    now = datetime.now(timezone.utc)
-
-    signals = [
-        # Analog FPV on Race Band 1 from test-kit-001
-        {
-            "time": now,
-            "kit_id": "test-kit-001",
-            "freq_mhz": 5658.0,
-            "power_dbm": -45.5,
-            "bandwidth_mhz": 10.0,
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 50.0,
-            "detection_type": "analog"
-        },
-        # Analog FPV on Race Band 8 from test-kit-001
-        {
-            "time": now,
-            "kit_id": "test-kit-001",
-            "freq_mhz": 5917.0,
-            "power_dbm": -52.0,
-            "bandwidth_mhz": 10.0,
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "detection_type": "analog"
-        },
-        # DJI digital FPV from test-kit-002
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "freq_mhz": 5745.0,
-            "power_dbm": -38.0,
-            "bandwidth_mhz": 20.0,
-            "lat": 37.7850,
-            "lon": -122.4100,
-            "detection_type": "dji"
-        },
-        # Weak analog signal from test-kit-002
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "freq_mhz": 5800.0,
-            "power_dbm": -78.5,
-            "bandwidth_mhz": 10.0,
-            "detection_type": "analog"
-        }
-    ]
-
-    for signal in signals:
-        await db_conn.execute(
-            """
-            INSERT INTO signals (
-                time, kit_id, freq_mhz, power_dbm, bandwidth_mhz,
-                lat, lon, alt, detection_type
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            """,
-            signal["time"], signal["kit_id"], signal["freq_mhz"],
-            signal["power_dbm"], signal["bandwidth_mhz"],
-            signal.get("lat"), signal.get("lon"), signal.get("alt"),
-            signal["detection_type"]
-        )
-
-    return signals
+    return sample_data["signals"]
 
 
-@pytest.fixture
-async def sample_health(db_conn, sample_kits) -> list[dict]:
+@pytest_asyncio.fixture
+async def sample_health(read_only_db, sample_data) -> list[dict]:
     """
-    Insert sample system health metrics into the database.
+    Sample system health metrics, loaded into the database.
 
     Returns:
         List of health metric dictionaries.
     """
-    now = datetime.now(timezone.utc)
-
-    health_records = [
-        {
-            "time": now,
-            "kit_id": "test-kit-001",
-            "lat": 37.7749,
-            "lon": -122.4194,
-            "alt": 10.0,
-            "cpu_percent": 45.5,
-            "memory_percent": 62.3,
-            "disk_percent": 38.7,
-            "uptime_hours": 72.5,
-            "temp_cpu": 55.0,
-            "temp_gpu": 48.0
-        },
-        {
-            "time": now,
-            "kit_id": "test-kit-002",
-            "lat": 37.7850,
-            "lon": -122.4100,
-            "alt": 15.0,
-            "cpu_percent": 38.2,
-            "memory_percent": 55.1,
-            "disk_percent": 42.0,
-            "uptime_hours": 120.0,
-            "temp_cpu": 52.0,
-            "temp_gpu": 45.0
-        }
-    ]
-
-    for health in health_records:
-        await db_conn.execute(
-            """
-            INSERT INTO system_health (
-                time, kit_id, lat, lon, alt,
-                cpu_percent, memory_percent, disk_percent,
-                uptime_hours, temp_cpu, temp_gpu
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            """,
-            health["time"], health["kit_id"],
-            health["lat"], health["lon"], health["alt"],
-            health["cpu_percent"], health["memory_percent"], health["disk_percent"],
-            health["uptime_hours"], health["temp_cpu"], health["temp_gpu"]
-        )
-
-    return health_records
+    return sample_data["system_health"]
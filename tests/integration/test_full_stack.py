@@ -20,6 +20,7 @@ import asyncio
 import csv
 import io
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 import pytest
 import httpx
 
@@ -44,11 +45,12 @@ class TestHealthCheck:
         assert result == 1
 
 
+@pytest.mark.usefixtures("read_only_db")
 class TestKitsAPI:
     """Test kit management API endpoints."""
 
     @pytest.mark.asyncio
-    async def test_list_all_kits(self, api_client, clean_database, sample_kits):
+    async def test_list_all_kits(self, api_client, sample_kits):
         """Test listing all configured kits."""
         response = api_client.get("/api/kits")
         assert response.status_code == 200
@@ -69,7 +71,7 @@ class TestKitsAPI:
         assert "last_seen" in kit
 
     @pytest.mark.asyncio
-    async def test_filter_kit_by_id(self, api_client, clean_database, sample_kits):
+    async def test_filter_kit_by_id(self, api_client, sample_kits):
         """Test filtering kits by specific ID."""
         target_kit_id = "test-kit-001"
         response = api_client.get(f"/api/kits?kit_id={target_kit_id}")
@@ -80,7 +82,7 @@ class TestKitsAPI:
         assert data["kits"][0]["kit_id"] == target_kit_id
 
     @pytest.mark.asyncio
-    async def test_kit_status_calculation(self, api_client, clean_database, sample_kits):
+    async def test_kit_status_calculation(self, api_client, sample_kits):
         """Test that kit status is calculated correctly based on last_seen."""
         response = api_client.get("/api/kits")
         assert response.status_code == 200
@@ -93,11 +95,12 @@ class TestKitsAPI:
         assert kits["test-kit-002"]["status"] == "online"
 
 
+@pytest.mark.usefixtures("read_only_db")
 class TestDronesAPI:
     """Test drone tracking API endpoints."""
 
     @pytest.mark.asyncio
-    async def test_query_all_drones(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_query_all_drones(self, api_client, sample_kits, sample_drones):
         """Test querying all drone tracks."""
         response = api_client.get("/api/drones?time_range=1h")
         assert response.status_code == 200
@@ -116,53 +119,26 @@ class TestDronesAPI:
         assert "track_type" in drone
 
     @pytest.mark.asyncio
-    async def test_filter_drones_by_kit(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test filtering drones by kit ID."""
-        target_kit = "test-kit-001"
-        response = api_client.get(f"/api/drones?time_range=1h&kit_id={target_kit}")
+    @pytest.mark.parametrize("column,value", [
+        ("kit_id", "test-kit-001"),
+        ("rid_make", "DJI"),
+        ("track_type", "drone"),
+        ("track_type", "aircraft"),
+    ])
+    async def test_drones_filter(self, column, value, api_client, sample_kits, sample_drones, expected_counts):
+        """Test filtering drones by kit ID, manufacturer (RID make) and track type."""
+        response = api_client.get(f"/api/drones?time_range=1h&{column}={value}")
         assert response.status_code == 200
 
         data = response.json()
-        expected_count = sum(1 for d in sample_drones if d["kit_id"] == target_kit)
-        assert data["count"] == expected_count
-
-        # Verify all returned drones are from target kit
-        for drone in data["drones"]:
-            assert drone["kit_id"] == target_kit
-
-    @pytest.mark.asyncio
-    async def test_filter_drones_by_make(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test filtering drones by manufacturer (RID make)."""
-        response = api_client.get("/api/drones?time_range=1h&rid_make=DJI")
-        assert response.status_code == 200
+        assert data["count"] == expected_counts["drones", column, value]
 
-        data = response.json()
-        expected_count = sum(1 for d in sample_drones if d.get("rid_make") == "DJI")
-        assert data["count"] == expected_count
-
-        # Verify all returned drones are DJI
+        # Verify all returned drones match the filter
         for drone in data["drones"]:
-            assert drone["rid_make"] == "DJI"
-
-    @pytest.mark.asyncio
-    async def test_filter_drones_by_track_type(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test filtering drones by track type (drone vs aircraft)."""
-        # Test drone type
-        response = api_client.get("/api/drones?time_range=1h&track_type=drone")
-        assert response.status_code == 200
-        data = response.json()
-        drone_count = sum(1 for d in sample_drones if d["track_type"] == "drone")
-        assert data["count"] == drone_count
-
-        # Test aircraft type
-        response = api_client.get("/api/drones?time_range=1h&track_type=aircraft")
-        assert response.status_code == 200
-        data = response.json()
-        aircraft_count = sum(1 for d in sample_drones if d["track_type"] == "aircraft")
-        assert data["count"] == aircraft_count
+            assert drone[column] == value
 
     @pytest.mark.asyncio
-    async def test_multi_kit_tracking(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_multi_kit_tracking(self, api_client, sample_kits, sample_drones):
         """Test that the same drone can be tracked by multiple kits."""
         # DJI-001 is tracked by both test-kit-001 and test-kit-002
         response = api_client.get("/api/drones?time_range=1h")
@@ -178,21 +154,21 @@ class TestDronesAPI:
         assert "test-kit-002" in kit_ids
 
     @pytest.mark.asyncio
-    async def test_multiple_kit_filter(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_multiple_kit_filter(self, api_client, sample_kits, sample_drones, expected_counts):
         """Test filtering by multiple kit IDs (comma-separated)."""
         response = api_client.get("/api/drones?time_range=1h&kit_id=test-kit-001,test-kit-002")
         assert response.status_code == 200
 
         data = response.json()
         # All drones from kit-001 and kit-002
-        expected_count = sum(
-            1 for d in sample_drones
-            if d["kit_id"] in ["test-kit-001", "test-kit-002"]
+        expected_count = (
+            expected_counts["drones", "kit_id", "test-kit-001"]
+            + expected_counts["drones", "kit_id", "test-kit-002"]
         )
         assert data["count"] == expected_count
 
     @pytest.mark.asyncio
-    async def test_limit_parameter(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_limit_parameter(self, api_client, sample_kits, sample_drones):
         """Test that limit parameter restricts result count."""
         response = api_client.get("/api/drones?time_range=1h&limit=2")
         assert response.status_code == 200
@@ -202,11 +178,12 @@ class TestDronesAPI:
         assert len(data["drones"]) <= 2
 
 
+@pytest.mark.usefixtures("read_only_db")
 class TestSignalsAPI:
     """Test FPV signal detection API endpoints."""
 
     @pytest.mark.asyncio
-    async def test_query_all_signals(self, api_client, clean_database, sample_kits, sample_signals):
+    async def test_query_all_signals(self, api_client, sample_kits, sample_signals):
         """Test querying all signal detections."""
         response = api_client.get("/api/signals?time_range=1h")
         assert response.status_code == 200
@@ -224,71 +201,46 @@ class TestSignalsAPI:
         assert "detection_type" in signal
 
     @pytest.mark.asyncio
-    async def test_filter_signals_by_kit(self, api_client, clean_database, sample_kits, sample_signals):
-        """Test filtering signals by kit ID."""
-        target_kit = "test-kit-001"
-        response = api_client.get(f"/api/signals?time_range=1h&kit_id={target_kit}")
+    @pytest.mark.parametrize("column,value", [
+        ("kit_id", "test-kit-001"),
+        ("detection_type", "analog"),
+        ("detection_type", "dji"),
+    ])
+    async def test_signals_filter(self, column, value, api_client, sample_kits, sample_signals, expected_counts):
+        """Test filtering signals by kit ID and detection type (analog vs DJI)."""
+        response = api_client.get(f"/api/signals?time_range=1h&{column}={value}")
         assert response.status_code == 200
 
         data = response.json()
-        expected_count = sum(1 for s in sample_signals if s["kit_id"] == target_kit)
-        assert data["count"] == expected_count
+        assert data["count"] == expected_counts["signals", column, value]
 
-        # Verify all returned signals are from target kit
+        # Verify all returned signals match the filter
         for signal in data["signals"]:
-            assert signal["kit_id"] == target_kit
-
-    @pytest.mark.asyncio
-    async def test_filter_signals_by_detection_type(self, api_client, clean_database, sample_kits, sample_signals):
-        """Test filtering signals by detection type (analog vs DJI)."""
-        # Test analog signals
-        response = api_client.get("/api/signals?time_range=1h&detection_type=analog")
-        assert response.status_code == 200
-        data = response.json()
-        analog_count = sum(1 for s in sample_signals if s["detection_type"] == "analog")
-        assert data["count"] == analog_count
-
-        # Test DJI signals
-        response = api_client.get("/api/signals?time_range=1h&detection_type=dji")
-        assert response.status_code == 200
-        data = response.json()
-        dji_count = sum(1 for s in sample_signals if s["detection_type"] == "dji")
-        assert data["count"] == dji_count
+            assert signal[column] == value
 
 
+@pytest.mark.usefixtures("read_only_db")
 class TestTimeRangeFiltering:
     """Test time-based filtering across endpoints."""
 
     @pytest.mark.asyncio
-    async def test_time_range_1h(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test 1-hour time range filter."""
-        response = api_client.get("/api/drones?time_range=1h")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert "time_range" in data
-        assert data["count"] > 0  # Should include recent sample data
-
-    @pytest.mark.asyncio
-    async def test_time_range_24h(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test 24-hour time range filter."""
-        response = api_client.get("/api/drones?time_range=24h")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["count"] > 0
+    async def test_relative_time_ranges(self, async_api_client, sample_kits, sample_drones):
+        """Test the 1-hour, 24-hour and 7-day time range filters."""
+        time_ranges = ["1h", "24h", "7d"]
+        responses = await asyncio.gather(*(
+            async_api_client.get(f"/api/drones?time_range={time_range}")
+            for time_range in time_ranges
+        ))
 
-    @pytest.mark.asyncio
-    async def test_time_range_7d(self, api_client, clean_database, sample_kits, sample_drones):
-        """Test 7-day time range filter."""
-        response = api_client.get("/api/drones?time_range=7d")
-        assert response.status_code == 200
+        for time_range, response in zip(time_ranges, responses):
+            assert response.status_code == 200, time_range
 
-        data = response.json()
-        assert data["count"] > 0
+            data = response.json()
+            assert "time_range" in data
+            assert data["count"] > 0, time_range  # Should include recent sample data
 
     @pytest.mark.asyncio
-    async def test_custom_time_range(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_custom_time_range(self, api_client, sample_kits, sample_drones):
         """Test custom time range with specific start and end times."""
         now = datetime.now(timezone.utc)
         start = (now - timedelta(hours=2)).isoformat()
@@ -303,47 +255,44 @@ class TestTimeRangeFiltering:
         assert data["time_range"]["end"]
 
 
+@pytest.mark.usefixtures("read_only_db")
 class TestDataAggregation:
     """Test multi-kit data aggregation capabilities."""
 
     @pytest.mark.asyncio
-    async def test_aggregate_drones_across_kits(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_aggregate_drones_across_kits(self, api_client, sample_kits, sample_drones):
         """Test aggregating drone data from all kits."""
         response = api_client.get("/api/drones?time_range=1h")
         assert response.status_code == 200
 
         data = response.json()
 
-        # Count unique drones (by drone_id)
-        unique_drones = set(d["drone_id"] for d in data["drones"])
-
         # Should have 4 unique drones: DJI-001, DJI-002, AUTEL-001, A1B2C3
         # Even though DJI-001 appears twice (tracked by 2 kits)
-        assert len(unique_drones) == 4
+        assert {d["drone_id"] for d in data["drones"]} == {"DJI-001", "DJI-002", "AUTEL-001", "A1B2C3"}
 
     @pytest.mark.asyncio
-    async def test_aggregate_signals_across_kits(self, api_client, clean_database, sample_kits, sample_signals):
+    async def test_aggregate_signals_across_kits(self, api_client, sample_kits, sample_signals):
         """Test aggregating signal data from all kits."""
         response = api_client.get("/api/signals?time_range=1h")
         assert response.status_code == 200
 
-        data = response.json()
+        signals = response.json()["signals"]
 
         # Verify we have signals from multiple kits
-        kit_ids = set(s["kit_id"] for s in data["signals"])
-        assert len(kit_ids) >= 2
+        assert len({s["kit_id"] for s in signals}) >= 2
 
         # Verify we have both analog and DJI detections
-        detection_types = set(s["detection_type"] for s in data["signals"])
-        assert "analog" in detection_types
-        assert "dji" in detection_types
+        assert {"analog", "dji"} <= {s["detection_type"] for s in signals}
 
 
+@pytest.mark.slow
+@pytest.mark.usefixtures("read_only_db")
 class TestCSVExport:
     """Test CSV export functionality with real data."""
 
     @pytest.mark.asyncio
-    async def test_export_csv_basic(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_export_csv_basic(self, api_client, sample_kits, sample_drones):
         """Test basic CSV export."""
         response = api_client.get("/api/export/csv?time_range=1h")
         assert response.status_code == 200
@@ -351,7 +300,7 @@ class TestCSVExport:
         assert "attachment" in response.headers["content-disposition"]
 
     @pytest.mark.asyncio
-    async def test_csv_content_structure(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_csv_content_structure(self, api_client, sample_kits, sample_drones):
         """Test that CSV content has correct structure and headers."""
         response = api_client.get("/api/export/csv?time_range=1h")
         assert response.status_code == 200
@@ -373,7 +322,7 @@ class TestCSVExport:
         assert len(rows) == len(sample_drones)
 
     @pytest.mark.asyncio
-    async def test_csv_filtered_export(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_csv_filtered_export(self, api_client, sample_kits, sample_drones, expected_counts):
         """Test CSV export with filters applied."""
         response = api_client.get("/api/export/csv?time_range=1h&rid_make=DJI")
         assert response.status_code == 200
@@ -383,7 +332,7 @@ class TestCSVExport:
         csv_reader = csv.DictReader(io.StringIO(csv_content))
         rows = list(csv_reader)
 
-        expected_count = sum(1 for d in sample_drones if d.get("rid_make") == "DJI")
+        expected_count = expected_counts["drones", "rid_make", "DJI"]
         assert len(rows) == expected_count
 
         # Verify all rows are DJI
@@ -391,7 +340,7 @@ class TestCSVExport:
             assert row["rid_make"] == "DJI"
 
     @pytest.mark.asyncio
-    async def test_csv_data_integrity(self, api_client, clean_database, sample_kits, sample_drones):
+    async def test_csv_data_integrity(self, api_client, sample_kits, sample_drones):
         """Test that CSV export contains accurate data from database."""
         response = api_client.get("/api/export/csv?time_range=1h&kit_id=test-kit-001")
         assert response.status_code == 200
@@ -416,20 +365,33 @@ class TestCSVExport:
 class TestCollectorDatabaseFlow:
     """Test the Collector → Database data flow."""
 
-    @pytest.mark.asyncio
-    async def test_insert_drone_via_collector_functions(self, db_conn, clean_database):
-        """Test inserting drone data directly (simulating collector behavior)."""
-        now = datetime.now(timezone.utc)
+    @pytest.fixture(scope="class")
+    def collector_kit(self, event_loop, db_conn, database_state, now):
+        """
+        Register a kit once for the whole class, as the collector would.
 
-        # Insert a kit first
-        await db_conn.execute(
+        The tests' own writes, including the status update, are rolled back
+        by db_transaction; the kit is deleted again when the class is done.
+        The kit is committed, so the tables no longer hold just the sample
+        data and read_only_db has to reload them.
+        """
+        kit_id = "collector-test-kit"
+        database_state["seeded"] = False
+        event_loop.run_until_complete(db_conn.execute(
             """
             INSERT INTO kits (kit_id, name, api_url, status, last_seen)
             VALUES ($1, $2, $3, $4, $5)
             """,
-            "collector-test-kit", "Collector Test", "http://test:8088", "online", now
-        )
+            kit_id, "Collector Test", "http://test:8088", "unknown", now
+        ))
 
+        yield kit_id
+
+        event_loop.run_until_complete(db_conn.execute("DELETE FROM kits WHERE kit_id = $1", kit_id))
+
+    @pytest.mark.asyncio
+    async def test_insert_drone_via_collector_functions(self, db_conn, db_transaction, collector_kit, now):
+        """Test inserting drone data directly (simulating collector behavior)."""
         # Insert a drone (simulating collector.insert_drones)
         await db_conn.execute(
             """
@@ -438,34 +400,23 @@ class TestCollectorDatabaseFlow:
                 rid_make, rid_model, track_type
             ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
             """,
-            now, "collector-test-kit", "TEST-DRONE-001",
+            now, collector_kit, "TEST-DRONE-001",
             38.0, -122.0, 100.0, 10.0, 180.0,
             "TestMake", "TestModel", "drone"
         )
 
         # Verify insertion
         result = await db_conn.fetchrow(
-            "SELECT * FROM drones WHERE drone_id = $1",
+            "SELECT kit_id, rid_make FROM drones WHERE drone_id = $1",
             "TEST-DRONE-001"
         )
         assert result is not None
-        assert result["kit_id"] == "collector-test-kit"
+        assert result["kit_id"] == collector_kit
         assert result["rid_make"] == "TestMake"
 
     @pytest.mark.asyncio
-    async def test_insert_signal_via_collector_functions(self, db_conn, clean_database):
+    async def test_insert_signal_via_collector_functions(self, db_conn, db_transaction, collector_kit, now):
         """Test inserting signal data directly (simulating collector behavior)."""
-        now = datetime.now(timezone.utc)
-
-        # Insert a kit first
-        await db_conn.execute(
-            """
-            INSERT INTO kits (kit_id, name, api_url, status, last_seen)
-            VALUES ($1, $2, $3, $4, $5)
-            """,
-            "collector-test-kit", "Collector Test", "http://test:8088", "online", now
-        )
-
         # Insert a signal (simulating collector.insert_signals)
         await db_conn.execute(
             """
@@ -473,44 +424,33 @@ class TestCollectorDatabaseFlow:
                 time, kit_id, freq_mhz, power_dbm, bandwidth_mhz, detection_type
             ) VALUES ($1, $2, $3, $4, $5, $6)
             """,
-            now, "collector-test-kit", 5800.0, -50.0, 10.0, "analog"
+            now, collector_kit, 5800.0, -50.0, 10.0, "analog"
         )
 
         # Verify insertion
         result = await db_conn.fetchrow(
-            "SELECT * FROM signals WHERE kit_id = $1 AND freq_mhz = $2",
-            "collector-test-kit", 5800.0
+            "SELECT power_dbm, detection_type FROM signals WHERE kit_id = $1 AND freq_mhz = $2",
+            collector_kit, 5800.0
         )
         assert result is not None
         assert result["power_dbm"] == pytest.approx(-50.0)
         assert result["detection_type"] == "analog"
 
     @pytest.mark.asyncio
-    async def test_update_kit_status(self, db_conn, clean_database):
+    async def test_update_kit_status(self, db_conn, db_transaction, collector_kit, now):
         """Test updating kit status (simulating collector.update_kit_status)."""
-        now = datetime.now(timezone.utc)
-
-        # Insert initial kit
-        await db_conn.execute(
-            """
-            INSERT INTO kits (kit_id, name, api_url, status, last_seen)
-            VALUES ($1, $2, $3, $4, $5)
-            """,
-            "status-test-kit", "Status Test", "http://test:8088", "unknown", now
-        )
-
         # Update status (simulating collector updating after successful poll)
         await db_conn.execute(
             """
             UPDATE kits SET status = $1, last_seen = $2 WHERE kit_id = $3
             """,
-            "online", now, "status-test-kit"
+            "online", now, collector_kit
         )
 
         # Verify update
         result = await db_conn.fetchrow(
-            "SELECT * FROM kits WHERE kit_id = $1",
-            "status-test-kit"
+            "SELECT status FROM kits WHERE kit_id = $1",
+            collector_kit
         )
         assert result["status"] == "online"
 
@@ -519,7 +459,7 @@ class TestFullStackIntegration:
     """End-to-end integration tests covering the complete stack."""
 
     @pytest.mark.asyncio
-    async def test_complete_data_flow(self, db_conn, api_client, clean_database):
+    async def test_complete_data_flow(self, db_conn, api_client, clean_database, now):
         """
         Test complete flow: Insert data via collector → Query via API → Verify results.
 
@@ -529,8 +469,6 @@ class TestFullStackIntegration:
         3. User queries API for drone data
         4. API returns correct data from database
         """
-        now = datetime.now(timezone.utc)
-
         # Step 1: Collector registers kit
         await db_conn.execute(
             """
@@ -548,17 +486,18 @@ class TestFullStackIntegration:
             ("AIRCRAFT-1", 37.7, -122.7, None, None),
         ]
 
-        for drone_id, lat, lon, make, model in drones_to_insert:
-            track_type = "aircraft" if drone_id.startswith("AIRCRAFT") else "drone"
-            await db_conn.execute(
-                """
-                INSERT INTO drones (
-                    time, kit_id, drone_id, lat, lon, alt, track_type, rid_make, rid_model
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """,
-                now, "integration-kit", drone_id, lat, lon, 100.0,
-                track_type, make, model
-            )
+        await db_conn.executemany(
+            """
+            INSERT INTO drones (
+                time, kit_id, drone_id, lat, lon, alt, track_type, rid_make, rid_model
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            """,
+            [
+                (now, "integration-kit", drone_id, lat, lon, 100.0,
+                 "aircraft" if drone_id.startswith("AIRCRAFT") else "drone", make, model)
+                for drone_id, lat, lon, make, model in drones_to_insert
+            ]
+        )
 
         # Step 3: User queries API for drones from this kit
         response = api_client.get("/api/drones?time_range=1h&kit_id=integration-kit")
@@ -579,7 +518,7 @@ class TestFullStackIntegration:
         assert drone_a["track_type"] == "drone"
 
     @pytest.mark.asyncio
-    async def test_multi_kit_aggregation_flow(self, db_conn, api_client, clean_database):
+    async def test_multi_kit_aggregation_flow(self, db_conn, api_client, clean_database, now):
         """
         Test multi-kit aggregation: Multiple kits track same drone.
 
@@ -588,31 +527,33 @@ class TestFullStackIntegration:
         2. Both detect the same drone
         3. API aggregates data from both kits
         """
-        now = datetime.now(timezone.utc)
-
         # Register two kits
-        for kit_num in [1, 2]:
-            await db_conn.execute(
-                """
-                INSERT INTO kits (kit_id, name, api_url, status, last_seen)
-                VALUES ($1, $2, $3, $4, $5)
-                """,
-                f"field-kit-{kit_num}", f"Field Kit {kit_num}",
-                f"http://field-{kit_num}:8088", "online", now
-            )
+        await db_conn.executemany(
+            """
+            INSERT INTO kits (kit_id, name, api_url, status, last_seen)
+            VALUES ($1, $2, $3, $4, $5)
+            """,
+            [
+                (f"field-kit-{kit_num}", f"Field Kit {kit_num}",
+                 f"http://field-{kit_num}:8088", "online", now)
+                for kit_num in [1, 2]
+            ]
+        )
 
         # Both kits detect the same drone
         shared_drone_id = "SHARED-DRONE-999"
-        for kit_num in [1, 2]:
-            await db_conn.execute(
-                """
-                INSERT INTO drones (
-                    time, kit_id, drone_id, lat, lon, alt, rssi, track_type
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
-                now, f"field-kit-{kit_num}", shared_drone_id,
-                37.8, -122.8, 150.0, -60 - (kit_num * 5), "drone"
-            )
+        await db_conn.executemany(
+            """
+            INSERT INTO drones (
+                time, kit_id, drone_id, lat, lon, alt, rssi, track_type
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            """,
+            [
+                (now, f"field-kit-{kit_num}", shared_drone_id,
+                 37.8, -122.8, 150.0, -60 - (kit_num * 5), "drone")
+                for kit_num in [1, 2]
+            ]
+        )
 
         # Query for all detections
         response = api_client.get("/api/drones?time_range=1h")
@@ -627,14 +568,13 @@ class TestFullStackIntegration:
         assert kit_ids == {"field-kit-1", "field-kit-2"}
 
     @pytest.mark.asyncio
-    async def test_export_after_data_insertion(self, db_conn, api_client, clean_database):
+    @pytest.mark.slow
+    async def test_export_after_data_insertion(self, db_conn, api_client, clean_database, now):
         """
         Test CSV export immediately after data insertion.
 
         Ensures exported data matches inserted data.
         """
-        now = datetime.now(timezone.utc)
-
         # Insert test data
         await db_conn.execute(
             """
@@ -649,15 +589,17 @@ class TestFullStackIntegration:
             ("EXPORT-DRONE-2", 40.1, -120.1, "Autel"),
         ]
 
-        for drone_id, lat, lon, make in test_drones:
-            await db_conn.execute(
-                """
-                INSERT INTO drones (
-                    time, kit_id, drone_id, lat, lon, alt, track_type, rid_make
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
-                now, "export-test-kit", drone_id, lat, lon, 100.0, "drone", make
-            )
+        await db_conn.executemany(
+            """
+            INSERT INTO drones (
+                time, kit_id, drone_id, lat, lon, alt, track_type, rid_make
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+            """,
+            [
+                (now, "export-test-kit", drone_id, lat, lon, 100.0, "drone", make)
+                for drone_id, lat, lon, make in test_drones
+            ]
+        )
 
         # Export to CSV
         response = api_client.get("/api/export/csv?time_range=1h&kit_id=export-test-kit")
@@ -676,17 +618,19 @@ class TestDataConsistency:
     """Test data consistency and integrity across the stack."""
 
     @pytest.mark.asyncio
-    async def test_database_api_consistency(self, db_conn, api_client, clean_database, sample_kits, sample_drones):
+    @pytest.mark.usefixtures("read_only_db")
+    async def test_database_api_consistency(self, db_conn, api_client, sample_kits, sample_drones):
         """Verify API returns exact data that exists in database."""
-        # Query database directly
+        # Query database directly, ordered the way Python sorts the API rows
+        # below (byte order; DJI-001 is tracked by two kits, so by kit too)
         db_drones = await db_conn.fetch(
-            "SELECT drone_id, kit_id, lat, lon FROM drones ORDER BY drone_id"
+            'SELECT drone_id, kit_id, lat, lon FROM drones ORDER BY drone_id COLLATE "C", kit_id COLLATE "C"'
         )
 
         # Query API
         response = api_client.get("/api/drones?time_range=1h&limit=10000")
         assert response.status_code == 200
-        api_drones = sorted(response.json()["drones"], key=lambda d: d["drone_id"])
+        api_drones = sorted(response.json()["drones"], key=itemgetter("drone_id", "kit_id"))
 
         # Compare counts
         assert len(db_drones) == len(api_drones)
@@ -701,10 +645,8 @@ class TestDataConsistency:
                 assert db_drone["lon"] == pytest.approx(api_drone["lon"], rel=1e-5)
 
     @pytest.mark.asyncio
-    async def test_duplicate_prevention(self, db_conn, clean_database):
+    async def test_duplicate_prevention(self, db_conn, db_transaction, now):
         """Test that duplicate drone records are handled correctly."""
-        now = datetime.now(timezone.utc)
-
         await db_conn.execute(
             """
             INSERT INTO kits (kit_id, name, api_url, status, last_seen)
@@ -25,15 +25,19 @@ import pytest
 # These tests require TestClient which triggers app startup
 pytestmark = pytest.mark.api
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch, call
-from fastapi.testclient import TestClient
-import io
+from fastapi.middleware.cors import CORSMiddleware
 import csv
+import os
 
 # Import after sys.path is set in conftest
 from api import app, parse_time_range, get_kit_status
 
 
+def _csv_head(response):
+    """Return the CSV header row of a response, reading only its first line."""
+    return next(csv.reader(response.iter_lines()))
+
+
 class TestHealthEndpoint:
     """Tests for GET /health endpoint."""
 
@@ -54,7 +58,7 @@ class TestHealthEndpoint:
         assert response.json() == {"status": "healthy"}
         mock_asyncpg_connection.fetchval.assert_called_once_with("SELECT 1")
 
-    def test_health_check_database_unavailable(self, client_with_mocked_db):
+    def test_health_check_database_unavailable(self, client_without_db):
         """
         Test health check when database pool is not initialized.
 
@@ -62,11 +66,10 @@ class TestHealthEndpoint:
         - Returns 503 status code
         - Error message indicates database pool not initialized
         """
-        with patch("api.db_pool", None):
-            response = client_with_mocked_db.get("/health")
+        response = client_without_db.get("/health")
 
-            assert response.status_code == 503
-            assert "Database pool not initialized" in response.json()["detail"]
+        assert response.status_code == 503
+        assert "Database pool not initialized" in response.json()["detail"]
 
     def test_health_check_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -87,7 +90,7 @@ class TestHealthEndpoint:
 class TestKitsEndpoint:
     """Tests for GET /api/kits endpoint."""
 
-    def test_list_all_kits(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kits, mock_asyncpg_row):
+    def test_list_all_kits(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kit_rows):
         """
         Test listing all kits without filters.
 
@@ -96,9 +99,7 @@ class TestKitsEndpoint:
         - Response contains all kits
         - Kit status is calculated based on last_seen
         """
-        # Convert sample data to mock rows
-        mock_rows = [mock_asyncpg_row(kit) for kit in api_sample_kits]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_kit_rows
 
         response = client_with_mocked_db.get("/api/kits")
 
@@ -109,7 +110,7 @@ class TestKitsEndpoint:
         assert data["count"] == 3
         assert len(data["kits"]) == 3
 
-    def test_list_kits_with_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kits, mock_asyncpg_row):
+    def test_list_kits_with_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kit_rows):
         """
         Test listing kits filtered by kit_id.
 
@@ -118,8 +119,7 @@ class TestKitsEndpoint:
         - Only returns matching kit
         """
         # Return only the first kit
-        mock_rows = [mock_asyncpg_row(api_sample_kits[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_kit_rows[:1]
 
         response = client_with_mocked_db.get("/api/kits?kit_id=kit001")
 
@@ -164,7 +164,7 @@ class TestKitsEndpoint:
 class TestDronesEndpoint:
     """Tests for GET /api/drones endpoint."""
 
-    def test_query_drones_default_params(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_default_params(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows, mock_asyncpg_row):
         """
         Test querying drones with default parameters (1h time range, no filters).
 
@@ -174,8 +174,10 @@ class TestDronesEndpoint:
         - Default limit is 1000
         - Drones are returned with correct structure
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
+        mock_asyncpg_connection.fetchrow.return_value = mock_asyncpg_row(
+            {"unique_drones": 3, "total_detections": 3}
+        )
 
         response = client_with_mocked_db.get("/api/drones")
 
@@ -187,7 +189,7 @@ class TestDronesEndpoint:
         assert data["count"] == 3
         assert len(data["drones"]) == 3
 
-    def test_query_drones_with_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test querying drones with different time ranges.
 
@@ -195,8 +197,7 @@ class TestDronesEndpoint:
         - Accepts time_range parameter (1h, 24h, 7d)
         - Query includes correct time bounds
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
 
         # Test with 24h range
         response = client_with_mocked_db.get("/api/drones?time_range=24h")
@@ -210,7 +211,7 @@ class TestDronesEndpoint:
         time_diff = end_time - start_time
         assert 23 <= time_diff.total_seconds() / 3600 <= 25  # Allow some tolerance
 
-    def test_query_drones_custom_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_custom_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test querying drones with custom time range.
 
@@ -218,8 +219,7 @@ class TestDronesEndpoint:
         - Accepts custom time range in format custom:START,END
         - Parses ISO datetime strings correctly
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
 
         start = "2026-01-20T10:00:00"
         end = "2026-01-20T12:00:00"
@@ -230,7 +230,7 @@ class TestDronesEndpoint:
         assert data["time_range"]["start"] == start
         assert data["time_range"]["end"] == end
 
-    def test_query_drones_with_kit_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_kit_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones_by):
         """
         Test querying drones filtered by kit_id.
 
@@ -239,9 +239,7 @@ class TestDronesEndpoint:
         - Query includes kit_id in WHERE clause
         """
         # Return only drones from kit001
-        filtered_drones = [d for d in api_sample_drones if d["kit_id"] == "kit001"]
-        mock_rows = [mock_asyncpg_row(drone) for drone in filtered_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drones_by["kit"]["kit001"]
 
         response = client_with_mocked_db.get("/api/drones?kit_id=kit001")
 
@@ -251,7 +249,7 @@ class TestDronesEndpoint:
         for drone in data["drones"]:
             assert drone["kit_id"] == "kit001"
 
-    def test_query_drones_with_multiple_kits(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_multiple_kits(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test querying drones with comma-separated kit_ids.
 
@@ -259,8 +257,7 @@ class TestDronesEndpoint:
         - Accepts comma-separated kit_id values
         - Query uses ANY() for multiple kit_ids
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
 
         response = client_with_mocked_db.get("/api/drones?kit_id=kit001,kit002")
 
@@ -268,7 +265,7 @@ class TestDronesEndpoint:
         # Verify the query was called with proper parameters
         assert mock_asyncpg_connection.fetch.called
 
-    def test_query_drones_with_rid_make_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_rid_make_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones_by):
         """
         Test querying drones filtered by RID make.
 
@@ -276,9 +273,7 @@ class TestDronesEndpoint:
         - Accepts rid_make filter parameter
         - Only returns drones with matching make
         """
-        dji_drones = [d for d in api_sample_drones if d.get("rid_make") == "DJI"]
-        mock_rows = [mock_asyncpg_row(drone) for drone in dji_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drones_by["rid_make"]["DJI"]
 
         response = client_with_mocked_db.get("/api/drones?rid_make=DJI")
 
@@ -287,7 +282,7 @@ class TestDronesEndpoint:
         for drone in data["drones"]:
             assert drone.get("rid_make") == "DJI"
 
-    def test_query_drones_with_track_type_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_track_type_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones_by):
         """
         Test querying drones filtered by track type.
 
@@ -295,9 +290,7 @@ class TestDronesEndpoint:
         - Accepts track_type filter (drone/aircraft)
         - Only returns matching track types
         """
-        aircraft = [d for d in api_sample_drones if d.get("track_type") == "aircraft"]
-        mock_rows = [mock_asyncpg_row(drone) for drone in aircraft]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drones_by["track_type"]["aircraft"]
 
         response = client_with_mocked_db.get("/api/drones?track_type=aircraft")
 
@@ -306,7 +299,7 @@ class TestDronesEndpoint:
         for drone in data["drones"]:
             assert drone.get("track_type") == "aircraft"
 
-    def test_query_drones_with_limit(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_with_limit(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test querying drones with custom limit.
 
@@ -314,8 +307,7 @@ class TestDronesEndpoint:
         - Accepts limit parameter
         - Maximum limit of 10000 is enforced
         """
-        mock_rows = [mock_asyncpg_row(api_sample_drones[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows[:1]
 
         response = client_with_mocked_db.get("/api/drones?limit=1")
 
@@ -334,7 +326,7 @@ class TestDronesEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    def test_query_drones_combined_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_query_drones_combined_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test querying drones with multiple filters combined.
 
@@ -342,8 +334,7 @@ class TestDronesEndpoint:
         - Multiple filters can be applied simultaneously
         - Query is constructed correctly with all filters
         """
-        mock_rows = [mock_asyncpg_row(api_sample_drones[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows[:1]
 
         response = client_with_mocked_db.get(
             "/api/drones?time_range=24h&kit_id=kit001&rid_make=DJI&track_type=drone&limit=100"
@@ -353,7 +344,7 @@ class TestDronesEndpoint:
         data = response.json()
         assert "drones" in data
 
-    def test_query_drones_database_unavailable(self, client_with_mocked_db):
+    def test_query_drones_database_unavailable(self, client_without_db):
         """
         Test error handling when database is unavailable.
 
@@ -361,11 +352,10 @@ class TestDronesEndpoint:
         - Returns 503 status code
         - Error message indicates database unavailable
         """
-        with patch("api.db_pool", None):
-            response = client_with_mocked_db.get("/api/drones")
+        response = client_without_db.get("/api/drones")
 
-            assert response.status_code == 503
-            assert "Database unavailable" in response.json()["detail"]
+        assert response.status_code == 503
+        assert "Database unavailable" in response.json()["detail"]
 
     def test_query_drones_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -386,7 +376,7 @@ class TestDronesEndpoint:
 class TestSignalsEndpoint:
     """Tests for GET /api/signals endpoint."""
 
-    def test_query_signals_default_params(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_default_params(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signal_rows):
         """
         Test querying signals with default parameters.
 
@@ -395,8 +385,7 @@ class TestSignalsEndpoint:
         - Returns signals with correct structure
         - Includes time range in response
         """
-        mock_rows = [mock_asyncpg_row(signal) for signal in api_sample_signals]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signal_rows
 
         response = client_with_mocked_db.get("/api/signals")
 
@@ -407,7 +396,7 @@ class TestSignalsEndpoint:
         assert "time_range" in data
         assert data["count"] == 3
 
-    def test_query_signals_with_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_with_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signal_rows):
         """
         Test querying signals with specific time range.
 
@@ -415,8 +404,7 @@ class TestSignalsEndpoint:
         - Time range parameter is applied correctly
         - Response includes time_range details
         """
-        mock_rows = [mock_asyncpg_row(signal) for signal in api_sample_signals]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signal_rows
 
         response = client_with_mocked_db.get("/api/signals?time_range=7d")
 
@@ -424,7 +412,7 @@ class TestSignalsEndpoint:
         data = response.json()
         assert "time_range" in data
 
-    def test_query_signals_with_kit_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_with_kit_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals_by):
         """
         Test querying signals filtered by kit_id.
 
@@ -432,9 +420,7 @@ class TestSignalsEndpoint:
         - Kit filter is applied correctly
         - Only signals from specified kit are returned
         """
-        kit001_signals = [s for s in api_sample_signals if s["kit_id"] == "kit001"]
-        mock_rows = [mock_asyncpg_row(signal) for signal in kit001_signals]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signals_by["kit"]["kit001"]
 
         response = client_with_mocked_db.get("/api/signals?kit_id=kit001")
 
@@ -443,7 +429,7 @@ class TestSignalsEndpoint:
         for signal in data["signals"]:
             assert signal["kit_id"] == "kit001"
 
-    def test_query_signals_with_detection_type_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_with_detection_type_filter(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals_by):
         """
         Test querying signals filtered by detection type.
 
@@ -451,9 +437,7 @@ class TestSignalsEndpoint:
         - Detection type filter is applied correctly
         - Only matching detection types are returned
         """
-        analog_signals = [s for s in api_sample_signals if s["detection_type"] == "analog"]
-        mock_rows = [mock_asyncpg_row(signal) for signal in analog_signals]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signals_by["detection_type"]["analog"]
 
         response = client_with_mocked_db.get("/api/signals?detection_type=analog")
 
@@ -462,7 +446,7 @@ class TestSignalsEndpoint:
         for signal in data["signals"]:
             assert signal["detection_type"] == "analog"
 
-    def test_query_signals_with_limit(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_with_limit(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signal_rows):
         """
         Test querying signals with custom limit.
 
@@ -470,8 +454,7 @@ class TestSignalsEndpoint:
         - Limit parameter is respected
         - Returns no more than specified limit
         """
-        mock_rows = [mock_asyncpg_row(api_sample_signals[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signal_rows[:1]
 
         response = client_with_mocked_db.get("/api/signals?limit=1")
 
@@ -479,7 +462,7 @@ class TestSignalsEndpoint:
         data = response.json()
         assert len(data["signals"]) <= 1
 
-    def test_query_signals_combined_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signals, mock_asyncpg_row):
+    def test_query_signals_combined_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_signal_rows):
         """
         Test querying signals with multiple filters.
 
@@ -487,8 +470,7 @@ class TestSignalsEndpoint:
         - Multiple filters work together correctly
         - Query construction handles all parameters
         """
-        mock_rows = [mock_asyncpg_row(api_sample_signals[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_signal_rows[:1]
 
         response = client_with_mocked_db.get(
             "/api/signals?time_range=1h&kit_id=kit001&detection_type=analog&limit=50"
@@ -498,18 +480,17 @@ class TestSignalsEndpoint:
         data = response.json()
         assert "signals" in data
 
-    def test_query_signals_database_unavailable(self, client_with_mocked_db):
+    def test_query_signals_database_unavailable(self, client_without_db):
         """
         Test error handling when database is unavailable.
 
         Verifies that:
         - Returns 503 status when db_pool is None
         """
-        with patch("api.db_pool", None):
-            response = client_with_mocked_db.get("/api/signals")
+        response = client_without_db.get("/api/signals")
 
-            assert response.status_code == 503
-            assert "Database unavailable" in response.json()["detail"]
+        assert response.status_code == 503
+        assert "Database unavailable" in response.json()["detail"]
 
     def test_query_signals_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -529,7 +510,7 @@ class TestSignalsEndpoint:
 class TestExportCSVEndpoint:
     """Tests for GET /api/export/csv endpoint."""
 
-    def test_export_csv_success(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_export_csv_success(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test successful CSV export of drone data.
 
@@ -539,8 +520,7 @@ class TestExportCSVEndpoint:
         - CSV contains header row
         - CSV data is properly formatted
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
 
         response = client_with_mocked_db.get("/api/export/csv")
 
@@ -549,13 +529,11 @@ class TestExportCSVEndpoint:
         assert "attachment" in response.headers["content-disposition"]
         assert "wardragon_drones_" in response.headers["content-disposition"]
 
-        # Verify CSV content
-        csv_content = response.text
-        assert len(csv_content) > 0
-        # Check for CSV header
-        assert "time" in csv_content or "drone_id" in csv_content
+        # Check the CSV header row
+        header = _csv_head(response)
+        assert header[:3] == ["time", "kit_id", "drone_id"]
 
-    def test_export_csv_with_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_export_csv_with_filters(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones_by):
         """
         Test CSV export with query filters.
 
@@ -563,14 +541,13 @@ class TestExportCSVEndpoint:
         - Filters are applied to CSV export
         - Only filtered data is included
         """
-        dji_drones = [d for d in api_sample_drones if d.get("rid_make") == "DJI"]
-        mock_rows = [mock_asyncpg_row(drone) for drone in dji_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drones_by["rid_make"]["DJI"]
 
         response = client_with_mocked_db.get("/api/export/csv?rid_make=DJI")
 
         assert response.status_code == 200
         assert "text/csv" in response.headers["content-type"]
+        assert "rid_make" in _csv_head(response)
 
     def test_export_csv_empty_result(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -588,7 +565,7 @@ class TestExportCSVEndpoint:
         # Empty result should still have valid CSV response
         assert len(response.text) >= 0
 
-    def test_export_csv_with_custom_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drones, mock_asyncpg_row):
+    def test_export_csv_with_custom_time_range(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_drone_rows):
         """
         Test CSV export with custom time range.
 
@@ -596,16 +573,16 @@ class TestExportCSVEndpoint:
         - Custom time range is applied to export
         - Data is filtered by time range
         """
-        mock_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_drone_rows
 
         start = "2026-01-20T10:00:00"
         end = "2026-01-20T12:00:00"
         response = client_with_mocked_db.get(f"/api/export/csv?time_range=custom:{start},{end}")
 
         assert response.status_code == 200
+        assert _csv_head(response)[0] == "time"
 
-    def test_export_csv_database_unavailable(self, client_with_mocked_db):
+    def test_export_csv_database_unavailable(self, client_without_db):
         """
         Test CSV export when database is unavailable.
 
@@ -613,10 +590,9 @@ class TestExportCSVEndpoint:
         - Returns 503 status
         - Error message indicates database unavailable
         """
-        with patch("api.db_pool", None):
-            response = client_with_mocked_db.get("/api/export/csv")
+        response = client_without_db.get("/api/export/csv")
 
-            assert response.status_code == 503
+        assert response.status_code == 503
 
     def test_export_csv_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """
@@ -633,45 +609,30 @@ class TestExportCSVEndpoint:
         assert response.status_code == 500
 
 
+@pytest.mark.usefixtures("frozen_api_clock")
 class TestTimeRangeParsing:
-    """Tests for parse_time_range() helper function."""
+    """Tests for parse_time_range() helper function (with the clock frozen)."""
 
-    def test_parse_1h_range(self):
+    @pytest.mark.parametrize("time_range, hours", [
+        ("1h", 1),
+        ("24h", 24),
+        ("7d", 7 * 24),
+        ("custom:invalid,format", 1),  # Falls back to the 1h default on parse error
+        ("unknown", 1),  # Unknown formats default to 1h
+    ])
+    def test_parse_relative_range(self, time_range, hours, frozen_api_clock):
         """
-        Test parsing 1h time range.
+        Test parsing relative, invalid and unknown time ranges.
 
         Verifies that:
-        - Returns start time approximately 1 hour before now
-        - End time is approximately now
+        - End time is now
+        - Start time is the expected number of hours before it
+        - Invalid or unknown formats fall back to the default 1h range
         """
-        start, end = parse_time_range("1h")
+        start, end = parse_time_range(time_range)
 
-        time_diff = end - start
-        assert 0.9 <= time_diff.total_seconds() / 3600 <= 1.1  # ~1 hour with tolerance
-
-    def test_parse_24h_range(self):
-        """
-        Test parsing 24h time range.
-
-        Verifies that:
-        - Returns start time approximately 24 hours before now
-        """
-        start, end = parse_time_range("24h")
-
-        time_diff = end - start
-        assert 23 <= time_diff.total_seconds() / 3600 <= 25  # ~24 hours with tolerance
-
-    def test_parse_7d_range(self):
-        """
-        Test parsing 7d time range.
-
-        Verifies that:
-        - Returns start time approximately 7 days before now
-        """
-        start, end = parse_time_range("7d")
-
-        time_diff = end - start
-        assert 6.5 <= time_diff.total_seconds() / 86400 <= 7.5  # ~7 days with tolerance
+        assert end == frozen_api_clock
+        assert start == frozen_api_clock - timedelta(hours=hours)
 
     def test_parse_custom_range(self):
         """
@@ -688,31 +649,6 @@ class TestTimeRangeParsing:
         assert start.isoformat() == start_str
         assert end.isoformat() == end_str
 
-    def test_parse_invalid_custom_range(self):
-        """
-        Test parsing invalid custom time range.
-
-        Verifies that:
-        - Falls back to default 1h range on parse error
-        """
-        start, end = parse_time_range("custom:invalid,format")
-
-        time_diff = end - start
-        # Should fall back to 1h default
-        assert 0.9 <= time_diff.total_seconds() / 3600 <= 1.1
-
-    def test_parse_unknown_range(self):
-        """
-        Test parsing unknown time range format.
-
-        Verifies that:
-        - Defaults to 1h for unknown formats
-        """
-        start, end = parse_time_range("unknown")
-
-        time_diff = end - start
-        assert 0.9 <= time_diff.total_seconds() / 3600 <= 1.1
-
     def test_parse_max_range_enforcement(self):
         """
         Test that maximum query range is enforced.
@@ -734,7 +670,7 @@ class TestTimeRangeParsing:
 class TestUIEndpoint:
     """Tests for GET / (UI) endpoint."""
 
-    def test_serve_ui_success(self, client_with_mocked_db, mock_template_file):
+    def test_serve_ui_success(self, client_with_mocked_db, mock_template_file, monkeypatch):
         """
         Test serving the UI HTML page.
 
@@ -743,18 +679,34 @@ class TestUIEndpoint:
         - Content-Type is text/html
         - HTML content is returned
         """
-        with patch("api.Path") as mock_path:
-            mock_path.return_value.parent = mock_template_file.parent
-            mock_file = mock_template_file.parent / "index.html"
+        monkeypatch.setattr("api.TEMPLATE_DIR", mock_template_file.parent)
+
+        response = client_with_mocked_db.get("/")
+
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+        assert response.text == mock_template_file.read_text()
+
+    def test_serve_ui_picks_up_template_edits(self, client_with_mocked_db, mock_template_file, monkeypatch):
+        """
+        Test that an edited template is served without a restart.
+
+        Verifies that:
+        - A template rewritten with a new modification time is re-read
+        """
+        monkeypatch.setattr("api.TEMPLATE_DIR", mock_template_file.parent)
+        client_with_mocked_db.get("/")
+
+        mock_template_file.write_text("<html><body>Edited</body></html>")
+        mtime = mock_template_file.stat().st_mtime + 1
+        os.utime(mock_template_file, (mtime, mtime))
 
-            response = client_with_mocked_db.get("/")
+        response = client_with_mocked_db.get("/")
 
-            # The endpoint tries to read from templates/index.html
-            # Since we're mocking, it may fail to find the file
-            # We just verify the endpoint exists
-            assert response.status_code in [200, 500]  # May fail if template not found
+        assert response.status_code == 200
+        assert "Edited" in response.text
 
-    def test_serve_ui_template_not_found(self, client_with_mocked_db, tmp_path):
+    def test_serve_ui_template_not_found(self, client_with_mocked_db, tmp_path, monkeypatch):
         """
         Test UI endpoint when template file is missing.
 
@@ -762,30 +714,32 @@ class TestUIEndpoint:
         - Returns 500 status when template doesn't exist
         - Error message indicates template not found
         """
-        with patch("api.Path") as mock_path:
-            # Point to non-existent directory
-            mock_path.return_value.parent = tmp_path / "nonexistent"
+        monkeypatch.setattr("api.TEMPLATE_DIR", tmp_path / "nonexistent")
 
-            response = client_with_mocked_db.get("/")
+        response = client_with_mocked_db.get("/")
 
-            assert response.status_code == 500
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Template not found"
 
 
 class TestCORSHeaders:
     """Tests for CORS headers (if configured)."""
 
+    @pytest.mark.skipif(
+        not any(m.cls is CORSMiddleware for m in app.user_middleware),
+        reason="CORS middleware not configured",
+    )
     def test_cors_headers_present(self, client_with_mocked_db):
         """
-        Test that CORS headers are configured if needed.
+        Test that CORS headers are sent when CORS middleware is configured.
 
-        Note: This test will pass if CORS is not configured.
-        Modify based on actual CORS requirements.
+        Verifies that:
+        - A cross-origin request gets an Access-Control-Allow-Origin header
         """
-        response = client_with_mocked_db.get("/health")
+        response = client_with_mocked_db.get("/health", headers={"Origin": "http://example.com"})
 
-        # CORS headers would be set by FastAPI middleware if configured
-        # This is a placeholder test - modify based on actual CORS setup
         assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
 
 
 class TestDatabaseQueryConstruction:
@@ -843,7 +797,7 @@ class TestGetKitStatusHelper:
     """Tests for get_kit_status() helper function."""
 
     @pytest.mark.asyncio
-    async def test_get_kit_status_all_kits(self, mock_asyncpg_pool, mock_asyncpg_connection, api_sample_kits, mock_asyncpg_row):
+    async def test_get_kit_status_all_kits(self, mocked_db_pool, mock_asyncpg_connection, api_sample_kit_rows, frozen_api_clock):
         """
         Test getting status for all kits.
 
@@ -851,18 +805,16 @@ class TestGetKitStatusHelper:
         - Returns all kits when no filter is provided
         - Status is calculated based on last_seen
         """
-        mock_rows = [mock_asyncpg_row(kit) for kit in api_sample_kits]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_kit_rows
 
-        with patch("api.db_pool", mock_asyncpg_pool):
-            kits = await get_kit_status()
+        kits = await get_kit_status()
 
-            assert len(kits) == 3
-            # Verify status calculation
-            assert any(k["status"] == "online" for k in kits)
+        assert len(kits) == 3
+        # Verify status calculation: seen 10s, 60s and 2h before the frozen clock
+        assert [k["status"] for k in kits] == ["online", "stale", "offline"]
 
     @pytest.mark.asyncio
-    async def test_get_kit_status_specific_kit(self, mock_asyncpg_pool, mock_asyncpg_connection, api_sample_kits, mock_asyncpg_row):
+    async def test_get_kit_status_specific_kit(self, mocked_db_pool, mock_asyncpg_connection, api_sample_kit_rows):
         """
         Test getting status for a specific kit.
 
@@ -870,17 +822,15 @@ class TestGetKitStatusHelper:
         - Returns single kit when kit_id is provided
         - Correct kit data is returned
         """
-        mock_rows = [mock_asyncpg_row(api_sample_kits[0])]
-        mock_asyncpg_connection.fetch.return_value = mock_rows
+        mock_asyncpg_connection.fetch.return_value = api_sample_kit_rows[:1]
 
-        with patch("api.db_pool", mock_asyncpg_pool):
-            kits = await get_kit_status("kit001")
+        kits = await get_kit_status("kit001")
 
-            assert len(kits) == 1
-            assert kits[0]["kit_id"] == "kit001"
+        assert len(kits) == 1
+        assert kits[0]["kit_id"] == "kit001"
 
     @pytest.mark.asyncio
-    async def test_get_kit_status_no_last_seen(self, mock_asyncpg_pool, mock_asyncpg_connection, mock_asyncpg_row):
+    async def test_get_kit_status_no_last_seen(self, mocked_db_pool, mock_asyncpg_connection, mock_asyncpg_row):
         """
         Test kit status when last_seen is None.
 
@@ -899,13 +849,13 @@ class TestGetKitStatusHelper:
         mock_rows = [mock_asyncpg_row(kit_data)]
         mock_asyncpg_connection.fetch.return_value = mock_rows
 
-        with patch("api.db_pool", mock_asyncpg_pool):
-            kits = await get_kit_status()
+        kits = await get_kit_status()
 
-            assert len(kits) == 1
-            assert kits[0]["status"] == "unknown"
+        assert len(kits) == 1
+        assert kits[0]["status"] == "unknown"
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("db_unavailable")
     async def test_get_kit_status_database_unavailable(self):
         """
         Test get_kit_status when database is unavailable.
@@ -913,9 +863,36 @@ class TestGetKitStatusHelper:
         Verifies that:
         - Raises HTTPException with 503 status
         """
-        with patch("api.db_pool", None):
-            with pytest.raises(Exception):  # Should raise HTTPException
-                await get_kit_status()
+        with pytest.raises(Exception):  # Should raise HTTPException
+            await get_kit_status()
+
+
+# Path, and a string its response body must contain
+SMOKE_PAGES = [
+    ("/health", "healthy"),
+    ("/", "<html"),
+    ("/docs", app.openapi_url),  # Docs pages load the app's OpenAPI schema
+    ("/redoc", app.openapi_url),
+]
+
+
+class TestEndpointAvailability:
+    """Smoke tests: pages and endpoints that should answer a plain GET."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path, expected", SMOKE_PAGES)
+    async def test_get_ok(self, async_api_client, mocked_db_pool, path, expected):
+        """
+        Test that the endpoint responds to a GET without errors.
+
+        Verifies that:
+        - Returns 200 status code
+        - The body is the expected page, not an error document
+        """
+        response = await async_api_client.get(path)
+
+        assert response.status_code == 200
+        assert expected in response.text
 
 
 class TestErrorHandling:
@@ -932,14 +909,23 @@ class TestErrorHandling:
 
         assert response.status_code == 404
 
-    def test_invalid_query_parameter_type(self, client_with_mocked_db):
+    @pytest.mark.parametrize("path, params", [
+        ("/api/drones", {"limit": "invalid"}),
+        ("/api/drones", {"limit": "20000"}),
+        ("/api/drones", {"deduplicate": "maybe"}),
+        ("/api/signals", {"limit": "1.5"}),
+        ("/api/signals", {"limit": "20000"}),
+        ("/api/drones/DJI-001/track", {"limit": "5000"}),
+        ("/api/patterns/repeated-drones", {"min_appearances": "1"}),
+    ])
+    def test_invalid_query_parameter_type(self, client_with_mocked_db, path, params):
         """
-        Test validation of query parameter types.
+        Test validation of query parameter types and bounds.
 
         Verifies that:
-        - Returns 422 for invalid parameter types
+        - Returns 422 for invalid parameter types or out-of-range values
         """
-        response = client_with_mocked_db.get("/api/drones?limit=invalid")
+        response = client_with_mocked_db.get(path, params=params)
 
         assert response.status_code == 422  # Validation error
 
@@ -948,7 +934,7 @@ class TestErrorHandling:
 class TestEndToEndWorkflow:
     """End-to-end tests simulating real usage patterns."""
 
-    def test_complete_workflow(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kits, api_sample_drones, api_sample_signals, mock_asyncpg_row):
+    def test_complete_workflow(self, client_with_mocked_db, mock_asyncpg_connection, api_sample_kit_rows, api_sample_drone_rows, api_sample_signals):
         """
         Test a complete workflow: health check -> list kits -> query drones -> export CSV.
 
@@ -957,8 +943,8 @@ class TestEndToEndWorkflow:
         - Data flows through the system as expected
         """
         # Setup mocks
-        kit_rows = [mock_asyncpg_row(kit) for kit in api_sample_kits]
-        drone_rows = [mock_asyncpg_row(drone) for drone in api_sample_drones]
+        kit_rows = api_sample_kit_rows
+        drone_rows = api_sample_drone_rows
 
         # 1. Health check
         mock_asyncpg_connection.fetchval.return_value = 1
@@ -982,3 +968,4 @@ class TestEndToEndWorkflow:
         response = client_with_mocked_db.get("/api/export/csv")
         assert response.status_code == 200
         assert "text/csv" in response.headers["content-type"]
+        assert _csv_head(response)[:3] == ["time", "kit_id", "drone_id"]
@@ -9,9 +9,10 @@ import pytest
 import os
 from datetime import datetime, timedelta
 
+# Every test here needs a live TimescaleDB
+pytestmark = [pytest.mark.integration, pytest.mark.database]
+
 
-@pytest.mark.integration
-@pytest.mark.database
 def test_database_connection():
     """Test database connection can be established."""
     # Only run if TEST_DATABASE_URL is set
@@ -23,8 +24,6 @@ def test_database_connection():
     pass
 
 
-@pytest.mark.integration
-@pytest.mark.database
 def test_insert_drone_detection():
     """Test inserting a drone detection into the database."""
     if not os.getenv("TEST_DATABASE_URL"):
@@ -35,8 +34,6 @@ def test_insert_drone_detection():
     pass
 
 
-@pytest.mark.integration
-@pytest.mark.database
 def test_query_time_range():
     """Test querying drones within a time range."""
     if not os.getenv("TEST_DATABASE_URL"):
@@ -48,8 +45,6 @@ def test_query_time_range():
     pass
 
 
-@pytest.mark.integration
-@pytest.mark.database
 @pytest.mark.slow
 def test_timescaledb_hypertable():
     """Test TimescaleDB hypertable functionality."""
@@ -61,8 +56,6 @@ def test_timescaledb_hypertable():
     pass
 
 
-@pytest.mark.integration
-@pytest.mark.database
 def test_continuous_aggregates():
     """Test TimescaleDB continuous aggregates."""
     if not os.getenv("TEST_DATABASE_URL"):
@@ -72,8 +65,6 @@ def test_continuous_aggregates():
     pass
 
 
-@pytest.mark.integration
-@pytest.mark.database
 def test_data_retention_policy():
     """Test data retention policy is enforced."""
     if not os.getenv("TEST_DATABASE_URL"):
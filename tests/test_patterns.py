@@ -20,12 +20,8 @@ import pytest
 # Mark all tests in this module as api tests (require app startup)
 pytestmark = pytest.mark.api
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
 import json
 
-# Import after sys.path is set in conftest
-from api import app
-
 
 class TestRepeatedDronesEndpoint:
     """Tests for GET /api/patterns/repeated-drones endpoint."""
@@ -114,16 +110,15 @@ class TestRepeatedDronesEndpoint:
         assert data["count"] == 0
         assert data["repeated_drones"] == []
 
-    def test_repeated_drones_database_unavailable(self, client_with_mocked_db):
+    def test_repeated_drones_database_unavailable(self, client_without_db):
         """
         Test error handling when database is unavailable.
 
         Verifies that:
         - Returns 503 status code
         """
-        with patch("api.db_pool", None):
-            response = client_with_mocked_db.get("/api/patterns/repeated-drones")
-            assert response.status_code == 503
+        response = client_without_db.get("/api/patterns/repeated-drones")
+        assert response.status_code == 503
 
     def test_repeated_drones_database_error(self, client_with_mocked_db, mock_asyncpg_connection):
         """